@@ -283,6 +283,7 @@ class AnnotatorWindow(QMainWindow):
         self.auto_box_items = []
         self.last_box_data = None
         self.training_dashboard_instance = None
+        self._class_picker = None  # Reusable class selection dialog (see pick_class)
 
         # Initialize StateManager (uses the class determined by tier logic via imports)
         try:
@@ -397,6 +398,14 @@ class AnnotatorWindow(QMainWindow):
                 "CRITICAL: No StateManager instance available for signal connection."
             )
 
+        # Keep the scene's cached class list in sync with the state manager
+        if self.graphics_scene and hasattr(self.graphics_scene, "refresh_class_cache"):
+            self.graphics_scene.refresh_class_cache()
+            if self.state and hasattr(self.state, "settings_changed"):
+                self.state.settings_changed.connect(
+                    self.graphics_scene.refresh_class_cache
+                )
+
         # Connect Scene Signals (should exist on real/dummy)
         if self.graphics_scene and hasattr(self.graphics_scene, "annotationsModified"):
             self.graphics_scene.annotationsModified.connect(
@@ -967,6 +976,21 @@ class AnnotatorWindow(QMainWindow):
             logger.warning("Paste failed: Scene or image not ready.")
             self.update_status("Paste failed: Load image first.")
 
+    def pick_class(self, title, label, classes, current_index=0):
+        """Shows the shared class picker dialog. Returns (class_name, ok)."""
+        if self._class_picker is None:
+            self._class_picker = QInputDialog(self)
+            self._class_picker.setInputMode(QInputDialog.InputMode.TextInput)
+            self._class_picker.setComboBoxEditable(False)
+        picker = self._class_picker
+        picker.setWindowTitle(title)
+        picker.setLabelText(label)
+        picker.setComboBoxItems(classes)
+        if 0 <= current_index < len(classes):
+            picker.setTextValue(classes[current_index])
+        ok = picker.exec() == QInputDialog.DialogCode.Accepted
+        return (picker.textValue() if ok else ""), ok
+
     def open_settings_dialog(self):
         """Opens legacy settings dialog (Basic & Pro)."""
         if not self.state:
@@ -1435,10 +1459,16 @@ class AnnotatorWindow(QMainWindow):
             self.update_status(f"Saving session to {os.path.basename(session_file)}...")
             QCoreApplication.processEvents()  # Update UI
 
-            self.state.save_session()  # Call the state manager's save method
+            # Synchronous; returns False if the write failed (details are in the log)
+            if self.state.save_session() is False:
+                QMessageBox.critical(
+                    self,
+                    "Save Error",
+                    f"Failed to save session to:\n{session_file}\nSee the log for details.",
+                )
+                self.update_status("Session save failed.")
+                return
 
-            # Check if save was successful (StateManager should log errors)
-            # We can assume success if no exception occurred, but could add checks later if needed
             self.update_status(f"Session saved: {os.path.basename(session_file)}.")
             logger.info(f"Session saved successfully via UI action to {session_file}.")
 
@@ -1790,7 +1820,7 @@ class AnnotatorWindow(QMainWindow):
                             except Exception as e_add:
                                 logger.error(
                                     f"Error adding annotation item {ann}: {e_add}",
-                                    exc_info=True,
+                                    exc_info=logger.isEnabledFor(logging.DEBUG),
                                 )
                         else:
                             logger.error(
@@ -35,6 +35,11 @@ DEFAULT_CONFIDENCE_THRESHOLD = (
 )
 DEFAULT_IMG_SIZE = 640  # Image size for training/prediction (Pro uses this heavily)
 
+# --- Rendering ---
+# Opt-in: a GL context that breaks after creation (VMs, RDP, bad drivers) shows a black canvas
+USE_OPENGL_VIEWPORT = False  # Render the annotation view through QOpenGLWidget
+PIXMAP_CACHE_LIMIT_KB = 512 * 1024  # QPixmapCache budget for recently viewed images
+
 # --- Training Parameters (Pro Features) ---
 DEFAULT_EPOCHS_20 = 3  # Default epochs for 20-image trigger (Pro)
 DEFAULT_LR_20 = 0.005  # Default learning rate for 20-image trigger (Pro)
@@ -45,6 +45,15 @@ class _DummyStateManager(QObject):
         # Simulate emitting signal on change for UI updates
         self.settings_changed.emit()
 
+    def get_many(self, keys, defaults=None):
+        defaults = defaults or {}
+        return {k: self.get_setting(k, defaults.get(k)) for k in keys}
+
+    def set_many(self, values):
+        self._settings.update(values)
+        logger.debug(f"Dummy settings set: {values}")
+        self.settings_changed.emit()
+
     def get_current_image(self):
         if self.image_list and 0 <= self.current_index < len(self.image_list):
             return self.image_list[self.current_index]
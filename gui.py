@@ -5,13 +5,13 @@ gui.py
 
 import logging
 import os
-import matplotlib.pyplot as plt
+import numpy as np
 from PyQt6.QtCore import QTimer  # ADDED: For itemChange update
 
-# Use the unified Qt-based canvas (works for Qt5 or Qt6) in Matplotlib 3.7+:
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-import pandas as pd
+# matplotlib and pandas are imported lazily by TrainingDashboard (Pro only)
 import traceback
+import csv
+import functools
 
 from PyQt6.QtCore import (
     Qt,
@@ -21,9 +21,12 @@ from PyQt6.QtCore import (
     pyqtSignal,
     QUrl,
     QObject,
+    QRunnable,
+    QThreadPool,
 )
 from PyQt6.QtGui import (
     QPixmap,
+    QPixmapCache,
     QPen,
     QColor,
     QPainter,
@@ -33,7 +36,9 @@ from PyQt6.QtGui import (
     QKeyEvent,
     QMouseEvent,
     QGuiApplication,
+    QImage,
     QImageReader,
+    QImageIOHandler,
     QDesktopServices,
     QPainterPath,
     QTransform,
@@ -66,6 +71,20 @@ import config
 
 logger_gui = logging.getLogger(__name__)
 
+# Optional GPU viewport for the annotation view
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+# Optional libjpeg-turbo decoder for the common JPEG case
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGRX
+
+    _turbo_jpeg = TurboJPEG()
+except Exception:  # ImportError, or the shared library is missing
+    _turbo_jpeg = None
+
 
 # --- Fallback or Real StateManager ---
 # (Assuming StateManager import logic remains as originally provided in gui.txt)
@@ -104,6 +123,22 @@ if _StateManagerGUI is None:
 StateManager = _StateManagerGUI
 
 
+# --- Handle drag operations: handle id -> fn(new_rect, diff, press_rect) ---
+_RESIZE_OPS = {
+    1: lambda r, d, m: r.setTopLeft(m.topLeft() + d),
+    2: lambda r, d, m: r.setTop(m.top() + d.y()),
+    3: lambda r, d, m: r.setTopRight(m.topRight() + d),
+    4: lambda r, d, m: r.setLeft(m.left() + d.x()),
+    6: lambda r, d, m: r.setRight(m.right() + d.x()),
+    7: lambda r, d, m: r.setBottomLeft(m.bottomLeft() + d),
+    8: lambda r, d, m: r.setBottom(m.bottom() + d.y()),
+    9: lambda r, d, m: r.setBottomRight(m.bottomRight() + d),
+}
+# Min-size clamp: handles listed here keep the left/top edge fixed, others the right/bottom one
+_MIN_W_PIN_LEFT = frozenset({1, 4, 7})
+_MIN_H_PIN_TOP = frozenset({1, 2, 3})
+
+
 # --- ResizableRectItem Class (Modified for Suggestions) ---
 class ResizableRectItem(QGraphicsRectItem):
     """
@@ -140,6 +175,85 @@ class ResizableRectItem(QGraphicsRectItem):
     }
     cornerHandles = [1, 3, 7, 9]
 
+    # --- Shared Visuals (class-level so items don't rebuild them) ---
+    _regular_pen_color = QColor(0, 255, 255, 220)  # Cyan
+    _regular_brush_color = QColor(0, 150, 150, 50)  # Cyan fill
+    _selected_pen_color = QColor(255, 255, 0, 255)  # Yellow
+    _selected_brush_color = QColor(150, 150, 0, 70)  # Yellow fill
+    _suggestion_pen_color = QColor(0, 255, 0, 180)  # Green
+    _suggestion_brush_color = QColor(0, 150, 0, 30)  # Lighter green fill
+    _suggestion_selected_pen_color = QColor(100, 255, 255, 220)  # Light blue
+    _suggestion_selected_brush_color = QColor(100, 150, 150, 60)
+    _regular_text_color = QColor(255, 255, 255, 200)  # White
+    _suggestion_text_color = QColor(200, 255, 200, 200)  # Light green
+
+    # Built lazily on first use: QFont/QCursor need a QGuiApplication
+    _label_font = None
+    _cursor_cache = {}
+    _style_cache = {}  # (is_suggestion, is_selected) -> (pen, brush, text color)
+    _handle_pen_cache = {}  # (rgba, width) -> bracket pen
+
+    @classmethod
+    def _get_label_font(cls):
+        if cls._label_font is None:
+            font = QFont()
+            font.setPointSize(10)
+            font.setBold(True)
+            cls._label_font = font
+        return cls._label_font
+
+    @classmethod
+    def _get_cursor(cls, shape):
+        cursor = cls._cursor_cache.get(shape)
+        if cursor is None:
+            cursor = cls._cursor_cache[shape] = QCursor(shape)
+        return cursor
+
+    @classmethod
+    def _get_style(cls, is_suggestion, is_selected):
+        key = (is_suggestion, is_selected)
+        style = cls._style_cache.get(key)
+        if style is None:
+            if is_suggestion:
+                pen = QPen(
+                    cls._suggestion_selected_pen_color
+                    if is_selected
+                    else cls._suggestion_pen_color,
+                    2,
+                )
+                pen.setStyle(Qt.PenStyle.DashLine)  # Dashed line for suggestions
+                brush = QBrush(
+                    cls._suggestion_selected_brush_color
+                    if is_selected
+                    else cls._suggestion_brush_color
+                )
+                text_color = cls._suggestion_text_color
+            else:
+                pen = QPen(
+                    cls._selected_pen_color if is_selected else cls._regular_pen_color,
+                    2.5 if is_selected else 2,
+                )
+                pen.setStyle(Qt.PenStyle.SolidLine)
+                brush = QBrush(
+                    cls._selected_brush_color
+                    if is_selected
+                    else cls._regular_brush_color
+                )
+                text_color = cls._regular_text_color
+            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+            style = cls._style_cache[key] = (pen, brush, text_color)
+        return style
+
+    @classmethod
+    def _get_handle_pen(cls, pen):
+        key = (pen.color().rgba(), pen.widthF())
+        handle_pen = cls._handle_pen_cache.get(key)
+        if handle_pen is None:
+            handle_pen = QPen(pen.color(), pen.widthF() * 1.2)
+            handle_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            cls._handle_pen_cache[key] = handle_pen
+        return handle_pen
+
     # MODIFICATION: Added is_suggestion flag
     def __init__(
         self,
@@ -171,6 +285,7 @@ class ResizableRectItem(QGraphicsRectItem):
         )
 
         self.handles = {}
+        self._handles_dirty = True  # Handle regions are rebuilt on first hit-test
         self.handleSelected = None
         self.mousePressPos = None
         self.mousePressRect = None
@@ -190,98 +305,59 @@ class ResizableRectItem(QGraphicsRectItem):
             QGraphicsRectItem.GraphicsItemFlag.ItemIsMovable, not self.is_suggestion
         )
 
-        # --- Visuals ---
-        # Define base colors (will be adjusted in paint based on state)
-        self._regular_pen_color = QColor(0, 255, 255, 220)  # Cyan
-        self._regular_brush_color = QColor(0, 150, 150, 50)  # Cyan fill
-        self._selected_pen_color = QColor(255, 255, 0, 255)  # Yellow
-        self._selected_brush_color = QColor(150, 150, 0, 70)  # Yellow fill
-        # ADDED: Suggestion-specific colors
-        self._suggestion_pen_color = QColor(0, 255, 0, 180)  # Green
-        self._suggestion_brush_color = QColor(
-            0, 150, 0, 30
-        )  # Lighter green fill for suggestions
-        self._suggestion_selected_pen_color = QColor(
-            100, 255, 255, 220
-        )  # Light blue when suggestion is selected
-
-        # Pen will be set dynamically in paint()
-        self.setPen(QPen(self._regular_pen_color, 2))
-        self.pen().setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-        self.setBrush(QBrush(self._regular_brush_color))
-
         # --- Text Label ---
-        # ADDED: Text color also depends on state
-        self._regular_text_color = QColor(255, 255, 255, 200)  # White
-        self._suggestion_text_color = QColor(200, 255, 200, 200)  # Light green
-
+        # Pen/brush/text colors are applied from the shared style cache in update_visuals()
         self.textItem = QGraphicsTextItem(self.class_label, self)
-        font = QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        self.textItem.setFont(font)
+        self.textItem.setFont(self._get_label_font())
+        self._text_w = self.textItem.boundingRect().width()
+        self._last_text_rect_w = -1.0  # Item width the label was last centered for
         self._updateTextPosition()
 
-        self.updateHandlesPos()
         self.update_visuals()  # ADDED: Apply initial visuals based on state
 
     # ADDED: Helper to update visuals based on state
     def update_visuals(self):
         """Sets the pen, brush, and text color based on current state."""
-        is_selected = self.isSelected()
-
+        current_pen, current_brush, text_color = self._get_style(
+            self.is_suggestion, self.isSelected()
+        )
         if self.is_suggestion:
-            current_pen = QPen(
-                self._suggestion_selected_pen_color
-                if is_selected
-                else self._suggestion_pen_color,
-                2,
-            )
-            current_pen.setStyle(Qt.PenStyle.DashLine)  # Dashed line for suggestions
-            current_brush = QBrush(
-                self._suggestion_brush_color
-                if not is_selected
-                else QColor(100, 150, 150, 60)
-            )
-            text_color = self._suggestion_text_color
             label_text = (
                 f"{self._original_label} ({self.confidence:.2f})"
                 if self.confidence is not None
                 else self._original_label
             )
         else:
-            current_pen = QPen(
-                self._selected_pen_color if is_selected else self._regular_pen_color,
-                2.5 if is_selected else 2,
-            )
-            current_pen.setStyle(Qt.PenStyle.SolidLine)
-            current_brush = QBrush(
-                self._selected_brush_color if is_selected else self._regular_brush_color
-            )
-            text_color = self._regular_text_color
             label_text = self.class_label
 
-        current_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
         self.setPen(current_pen)
         self.setBrush(current_brush)
         if self.textItem:
             self.textItem.setDefaultTextColor(text_color)
             if self.textItem.toPlainText() != label_text:
-                self.textItem.setPlainText(label_text)
-                self._updateTextPosition()  # Recenter if text changed
+                self._setLabelText(label_text)  # Recenters the new text
         self.update()  # Trigger repaint
 
-    def _updateTextPosition(self):
-        """Centers the text label within the bounding box."""
+    def _updateTextPosition(self, force=False):
+        """Centers the text label within the bounding box (only when the width changed)."""
         if self.textItem:
-            text_rect = self.textItem.boundingRect()
-            item_rect = self.rect()
-            x = (item_rect.width() - text_rect.width()) / 2
+            item_w = self.rect().width()
+            if not force and item_w == self._last_text_rect_w:
+                return  # Height-only resizes and moves keep the label where it is
+            self._last_text_rect_w = item_w
+            x = (item_w - self._text_w) / 2
             y = 2  # Small offset from the top edge
             self.textItem.setPos(x, y)
 
+    def _setLabelText(self, text):
+        """Sets the label text, refreshing the cached text width and position."""
+        self.textItem.setPlainText(text)
+        self._text_w = self.textItem.boundingRect().width()
+        self._updateTextPosition(force=True)
+
     def handleAt(self, point: QPointF) -> int | None:
         """Check if the point is within any handle region."""
+        self._ensure_handles()
         for k in reversed(sorted(self.handles.keys())):
             if self.handles[k].contains(point):
                 return k
@@ -302,7 +378,7 @@ class ResizableRectItem(QGraphicsRectItem):
                 Qt.CursorShape.PointingHandCursor
             )  # Indicate clickable suggestion
 
-        self.setCursor(QCursor(cursor_shape))
+        self.setCursor(self._get_cursor(cursor_shape))
         super().hoverMoveEvent(moveEvent)
 
     def hoverLeaveEvent(self, leaveEvent: QGraphicsSceneMouseEvent):
@@ -357,40 +433,36 @@ class ResizableRectItem(QGraphicsRectItem):
         diff = mousePos - self.mousePressPos
         self.prepareGeometryChange()
         new_rect = QRectF(self.mousePressRect)
-        if self.handleSelected == 1:
-            new_rect.setTopLeft(self.mousePressRect.topLeft() + diff)
-        elif self.handleSelected == 2:
-            new_rect.setTop(self.mousePressRect.top() + diff.y())
-        elif self.handleSelected == 3:
-            new_rect.setTopRight(self.mousePressRect.topRight() + diff)
-        elif self.handleSelected == 4:
-            new_rect.setLeft(self.mousePressRect.left() + diff.x())
-        elif self.handleSelected == 6:
-            new_rect.setRight(self.mousePressRect.right() + diff.x())
-        elif self.handleSelected == 7:
-            new_rect.setBottomLeft(self.mousePressRect.bottomLeft() + diff)
-        elif self.handleSelected == 8:
-            new_rect.setBottom(self.mousePressRect.bottom() + diff.y())
-        elif self.handleSelected == 9:
-            new_rect.setBottomRight(self.mousePressRect.bottomRight() + diff)
+        resize_op = _RESIZE_OPS.get(self.handleSelected)
+        if resize_op is not None:
+            resize_op(new_rect, diff, self.mousePressRect)
 
         normalized_rect = new_rect.normalized()
         minSize = 5.0
         if normalized_rect.width() < minSize:
-            if self.handleSelected in [1, 4, 7]:
+            if self.handleSelected in _MIN_W_PIN_LEFT:
                 normalized_rect.setWidth(minSize)
             else:
                 normalized_rect.setLeft(normalized_rect.right() - minSize)
         if normalized_rect.height() < minSize:
-            if self.handleSelected in [1, 2, 3]:
+            if self.handleSelected in _MIN_H_PIN_TOP:
                 normalized_rect.setHeight(minSize)
             else:
                 normalized_rect.setTop(normalized_rect.bottom() - minSize)
 
         self.setRect(normalized_rect)
-        self.updateHandlesPos()
         self._updateTextPosition()
 
+    def setRect(self, *args):
+        """Sets the rect and marks the handle regions stale."""
+        super().setRect(*args)
+        self._handles_dirty = True
+
+    def _ensure_handles(self):
+        """Recomputes the handle regions if the rect changed since the last call."""
+        if self._handles_dirty:
+            self.updateHandlesPos()
+
     def updateHandlesPos(self):
         """Calculate the positions of the handle *regions* based on the current rect."""
         s = self.handleSize
@@ -406,12 +478,14 @@ class ResizableRectItem(QGraphicsRectItem):
         self.handles[7] = QRectF(r.left() + hs, r.bottom() - s - hs, s, s)
         self.handles[8] = QRectF(cx - s / 2, r.bottom() - s - hs, s, s)
         self.handles[9] = QRectF(r.right() - s - hs, r.bottom() - s - hs, s, s)
+        self._handles_dirty = False
 
     def shape(self) -> QPainterPath:
         """Define the collision shape, including handle areas when selected (and not suggestion)."""
         path = QPainterPath()
         path.addRect(self.rect())
         if self.isSelected() and not self.is_suggestion:
+            self._ensure_handles()
             for k, hr in self.handles.items():
                 if k in self.cornerHandles:
                     path.addRect(hr)
@@ -429,9 +503,7 @@ class ResizableRectItem(QGraphicsRectItem):
 
         if option.state & QStyle.StateFlag.State_Selected and not self.is_suggestion:
             handle_length = self.handleSize * 0.8
-            handle_pen = QPen(current_pen.color(), current_pen.widthF() * 1.2)
-            handle_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            painter.setPen(handle_pen)
+            painter.setPen(self._get_handle_pen(current_pen))
             painter.setBrush(Qt.BrushStyle.NoBrush)
             r = self.rect()
             topLeft = r.topLeft()
@@ -507,7 +579,12 @@ class ResizableRectItem(QGraphicsRectItem):
             return None
         scene_rect = self.sceneBoundingRect()
         try:
-            pixel_rect = img_item.mapRectFromScene(scene_rect)
+            scene_to_pixel = getattr(scene, "_scene_to_pixel", None)
+            pixel_rect = (
+                scene_to_pixel.mapRect(scene_rect)
+                if scene_to_pixel is not None
+                else img_item.mapRectFromScene(scene_rect)
+            )
         except Exception as map_err:
             logger_gui.error(
                 f"Error mapping scene rect to pixel rect: {map_err}", exc_info=True
@@ -569,14 +646,20 @@ class ResizableRectItem(QGraphicsRectItem):
                     f"Current label '{self.class_label}' not in available classes: {available_classes}."
                 )
 
-            new_label, ok = QInputDialog.getItem(
-                parent_window,
-                "Change Class",
-                "Select new class:",
-                available_classes,
-                current_index if current_index != -1 else 0,
-                False,
-            )
+            start_index = current_index if current_index != -1 else 0
+            if hasattr(parent_window, "pick_class"):
+                new_label, ok = parent_window.pick_class(
+                    "Change Class", "Select new class:", available_classes, start_index
+                )
+            else:
+                new_label, ok = QInputDialog.getItem(
+                    parent_window,
+                    "Change Class",
+                    "Select new class:",
+                    available_classes,
+                    start_index,
+                    False,
+                )
 
             if ok and new_label:
                 if new_label != self.class_label:
@@ -584,8 +667,7 @@ class ResizableRectItem(QGraphicsRectItem):
                         f"Changing label from '{self.class_label}' to '{new_label}'."
                     )
                     self.class_label = new_label
-                    self.textItem.setPlainText(self.class_label)
-                    self._updateTextPosition()
+                    self._setLabelText(self.class_label)
                     self.update()
                     if self.scene() and hasattr(self.scene(), "annotationsModified"):
                         self.scene().annotationsModified.emit()
@@ -609,78 +691,153 @@ class AnnotationScene(QGraphicsScene):
         super().__init__(parent)
         self.parent_window = parent
         self.image_item = QGraphicsPixmapItem()
+        # Static between set_image calls, so cache its rasterization at the current zoom.
+        # (Not used on ResizableRectItem: its geometry changes constantly.)
+        self.image_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.addItem(self.image_item)
         self.image_item.setZValue(-10)
         self.start_point = QPointF()
         self.current_rect_item = None
         self.drawing = False
         self.selection_tool = "bbox"
+        # Image bounds in scene coords, refreshed on every set_image
+        self._img_left = self._img_top = 0.0
+        self._img_right = self._img_bottom = 0.0
+        # Scene -> image pixel mapping, refreshed on every set_image
+        self._scene_to_pixel = QTransform()
+        self._cached_classes = []  # Class list offered when labelling new boxes
+        # Decoded images are kept in QPixmapCache so flipping back is a lookup
+        QPixmapCache.setCacheLimit(config.PIXMAP_CACHE_LIMIT_KB)
         logger_gui.info("AnnotationScene initialized.")
 
+    def refresh_class_cache(self):
+        """Re-reads the class list from the parent window's state manager."""
+        state = getattr(self.parent_window, "state", None)
+        self._cached_classes = list(getattr(state, "class_list", None) or [])
+
+    def _update_image_bounds(self):
+        """Caches the image item's scene bounds and inverse transform after a load."""
+        r = self.image_item.sceneBoundingRect()
+        self._img_left, self._img_top = r.left(), r.top()
+        self._img_right, self._img_bottom = r.right(), r.bottom()
+        inverse, invertible = self.image_item.sceneTransform().inverted()
+        self._scene_to_pixel = inverse if invertible else QTransform()
+
+    def _clamp_to_image(self, x, y):
+        """Clamps scene coordinates to the cached image bounds."""
+        x = self._img_left if x < self._img_left else min(x, self._img_right)
+        y = self._img_top if y < self._img_top else min(y, self._img_bottom)
+        return QPointF(x, y)
+
+    def _clear_image(self):
+        """Resets the background pixmap and scene rect to the empty state."""
+        self.image_item.setPixmap(QPixmap())
+        self.image_item.update()
+        self.setSceneRect(QRectF(0, 0, 1, 1))
+        self._update_image_bounds()
+
+    def _read_pixmap(self, image_path):
+        """Decodes an image file into a QPixmap (null pixmap on failure)."""
+        reader = QImageReader(image_path)
+        # Apply EXIF orientation so the scene matches what the training loader sees
+        reader.setAutoTransform(True)
+        if not reader.canRead():
+            # Reader can't handle it; the Pixmap fallback is the only decode attempted.
+            logger_gui.error(f"QImageReader cannot read: {image_path}")
+            pixmap = QPixmap(image_path)
+            if not pixmap.isNull():
+                logger_gui.info(
+                    f"Image decoded via Pixmap fallback: {os.path.basename(image_path)}"
+                )
+            return pixmap
+
+        original_size = reader.size()
+        max_dim = 4096
+        if original_size.width() <= max_dim and original_size.height() <= max_dim:
+            # Common case: no scaling needed, so JPEGs can skip Qt's decoder. turbojpeg
+            # ignores EXIF, so images with an orientation tag stay on the Qt path.
+            if (
+                _turbo_jpeg is not None
+                and bytes(reader.format()) == b"jpeg"
+                and reader.transformation()
+                == QImageIOHandler.Transformation.TransformationNone
+            ):
+                pixmap = self._read_jpeg_turbo(image_path)
+                if not pixmap.isNull():
+                    return pixmap
+        else:
+            scale_factor = min(
+                max_dim / original_size.width(), max_dim / original_size.height()
+            )
+            new_width = int(original_size.width() * scale_factor)
+            new_height = int(original_size.height() * scale_factor)
+            reader.setScaledSize(QSize(new_width, new_height))
+            logger_gui.info(
+                f"Scaled image from {original_size.width()}x{original_size.height()} to {new_width}x{new_height}"
+            )
+
+        image = reader.read()
+        if image.isNull():
+            logger_gui.error(
+                f"Failed read image data: {image_path}, Error: {reader.errorString()}"
+            )
+            return QPixmap()
+        return QPixmap.fromImage(image)
+
+    def _read_jpeg_turbo(self, image_path):
+        """Decodes a JPEG with libjpeg-turbo (null pixmap on failure)."""
+        try:
+            with open(image_path, "rb") as f:
+                bgrx = _turbo_jpeg.decode(f.read(), pixel_format=TJPF_BGRX)
+        except Exception as e:
+            logger_gui.debug(f"turbojpeg decode failed for {image_path}: {e}")
+            return QPixmap()
+        h, w = bgrx.shape[:2]
+        # Format_RGB32 is BGRX in memory; fromImage copies before bgrx is released
+        image = QImage(bgrx.data, w, h, w * 4, QImage.Format.Format_RGB32)
+        return QPixmap.fromImage(image)
+
     def set_image(self, image_path):
         """Loads or clears the background image."""
         if image_path is None:
-            self.image_item.setPixmap(QPixmap())
-            self.setSceneRect(QRectF(0, 0, 1, 1))
+            self._clear_image()
             logger_gui.info("Scene image cleared.")
             return True
 
         try:
-            reader = QImageReader(image_path)
-            if not reader.canRead():
-                logger_gui.error(f"QImageReader cannot read: {image_path}")
-                pixmap = QPixmap(image_path)
-                if pixmap.isNull():
-                    logger_gui.error(
-                        f"Failed load (Pixmap fallback failed): {image_path}"
-                    )
-                    self.image_item.setPixmap(QPixmap())
-                    self.setSceneRect(QRectF(0, 0, 1, 1))
-                    return False
-                else:
-                    self.image_item.setPixmap(pixmap)
-                    self.setSceneRect(self.image_item.boundingRect())
-                    logger_gui.info(
-                        f"Image loaded (via Pixmap fallback): {os.path.basename(image_path)}"
-                    )
-                    return True
-
-            original_size = reader.size()
-            max_dim = 4096
-            if original_size.width() > max_dim or original_size.height() > max_dim:
-                scale_factor = min(
-                    max_dim / original_size.width(), max_dim / original_size.height()
-                )
-                new_width = int(original_size.width() * scale_factor)
-                new_height = int(original_size.height() * scale_factor)
-                reader.setScaledSize(QSize(new_width, new_height))
-                logger_gui.info(
-                    f"Scaled image from {original_size.width()}x{original_size.height()} to {new_width}x{new_height}"
-                )
-
-            image = reader.read()
-            if image.isNull():
+            # Key on mtime too so an image edited on disk is decoded again
+            cache_key = f"{image_path}|{os.stat(image_path).st_mtime_ns}"
+        except OSError:
+            cache_key = None
+        pixmap = QPixmapCache.find(cache_key) if cache_key else None
+        if pixmap is not None and not pixmap.isNull():
+            logger_gui.debug(f"Pixmap cache hit: {os.path.basename(image_path)}")
+        else:
+            try:
+                pixmap = self._read_pixmap(image_path)
+            except Exception as e:
+                # Tracebacks only at DEBUG: formatting them is costly on repeated failures
                 logger_gui.error(
-                    f"Failed read image data: {image_path}, Error: {reader.errorString()}"
+                    f"Exception loading image {image_path}: {e}",
+                    exc_info=logger_gui.isEnabledFor(logging.DEBUG),
                 )
-                self.image_item.setPixmap(QPixmap())
-                self.setSceneRect(QRectF(0, 0, 1, 1))
-                return False
+                pixmap = QPixmap()
+            if cache_key and not pixmap.isNull():
+                QPixmapCache.insert(cache_key, pixmap)
 
-            pixmap = QPixmap.fromImage(image)
-            self.image_item.setPixmap(pixmap)
-            self.setSceneRect(self.image_item.boundingRect())
-            logger_gui.info(f"Image loaded into scene: {os.path.basename(image_path)}")
-            return True
-
-        except Exception as e:
-            logger_gui.error(
-                f"Exception loading image {image_path}: {e}", exc_info=True
-            )
-            self.image_item.setPixmap(QPixmap())
-            self.setSceneRect(QRectF(0, 0, 1, 1))
+        if pixmap.isNull():
+            logger_gui.error(f"Failed load: {image_path}")
+            self._clear_image()
             return False
 
+        self.image_item.setPixmap(pixmap)
+        self.image_item.update()  # Invalidate the device-coordinate cache
+        self.setSceneRect(self.image_item.boundingRect())
+        self._update_image_bounds()
+        self.refresh_class_cache()
+        logger_gui.info(f"Image loaded into scene: {os.path.basename(image_path)}")
+        return True
+
     def get_image_size(self):
         """Returns the dimensions (width, height) of the loaded image."""
         if self.image_item and not self.image_item.pixmap().isNull():
@@ -735,14 +892,8 @@ class AnnotationScene(QGraphicsScene):
             and self.image_item
             and not self.image_item.pixmap().isNull()
         ):
-            self.start_point = event.scenePos()
-            img_rect = self.image_item.sceneBoundingRect()
-            self.start_point.setX(
-                max(img_rect.left(), min(self.start_point.x(), img_rect.right()))
-            )
-            self.start_point.setY(
-                max(img_rect.top(), min(self.start_point.y(), img_rect.bottom()))
-            )
+            pos = event.scenePos()
+            self.start_point = self._clamp_to_image(pos.x(), pos.y())
             self.drawing = True
             self.current_rect_item = QGraphicsRectItem(
                 QRectF(self.start_point, self.start_point)
@@ -760,14 +911,8 @@ class AnnotationScene(QGraphicsScene):
             if not self.image_item or self.image_item.pixmap().isNull():
                 self.cancel_drawing()
                 return
-            current_pos = event.scenePos()
-            img_rect = self.image_item.sceneBoundingRect()
-            current_pos.setX(
-                max(img_rect.left(), min(current_pos.x(), img_rect.right()))
-            )
-            current_pos.setY(
-                max(img_rect.top(), min(current_pos.y(), img_rect.bottom()))
-            )
+            pos = event.scenePos()
+            current_pos = self._clamp_to_image(pos.x(), pos.y())
             rect = QRectF(self.start_point, current_pos).normalized()
             self.current_rect_item.setRect(rect)
             event.accept()
@@ -881,21 +1026,16 @@ class AnnotationScene(QGraphicsScene):
     def prompt_for_label(self):
         """Prompts the user to select or enter a class label."""
         parent_widget = self.views()[0] if self.views() else None
-        available_classes = []
+        available_classes = self._cached_classes
         label_to_return = None
         ok_status = False
 
-        if (
-            hasattr(self, "parent_window")
-            and self.parent_window
-            and hasattr(self.parent_window, "state")
-            and self.parent_window.state
-            and hasattr(self.parent_window.state, "class_list")
-        ):
-            available_classes = getattr(self.parent_window.state, "class_list", [])
-
         try:
-            if available_classes:
+            if available_classes and hasattr(self.parent_window, "pick_class"):
+                label, ok = self.parent_window.pick_class(
+                    "Select Label", "Class:", available_classes, 0
+                )
+            elif available_classes:
                 label, ok = QInputDialog.getItem(
                     parent_widget,
                     "Select Label",
@@ -965,9 +1105,10 @@ class AnnotationScene(QGraphicsScene):
             )
             return False
         except Exception as e:
+            # Called once per box on bulk loads; only format tracebacks at DEBUG
             logger_gui.error(
                 f"Unexpected error adding item from data {annotation_data}: {e}",
-                exc_info=True,
+                exc_info=logger_gui.isEnabledFor(logging.DEBUG),
             )
             return False
 
@@ -993,7 +1134,6 @@ class AnnotationScene(QGraphicsScene):
 
     def get_all_annotations(self):
         """Retrieves annotation data (pixel coords) from all NON-SUGGESTION boxes."""
-        annotations = []
         img_w, img_h = self.get_image_size()
         if img_w <= 0 or img_h <= 0:
             logger_gui.error("Cannot get annotations: Image invalid.")
@@ -1004,16 +1144,38 @@ class AnnotationScene(QGraphicsScene):
                 "Cannot get annotations: ResizableRectItem class unavailable or dummy."
             )
             return []
-        for item in self.items():
-            if isinstance(item, rect_item_class) and not item.is_suggestion:
-                if hasattr(item, "get_annotation_data"):
-                    data = item.get_annotation_data(img_w, img_h)
-                    if data:
-                        annotations.append(data)
-                else:
-                    logger_gui.warning(
-                        "Found ResizableRectItem instance lacking get_annotation_data method."
-                    )
+        box_items = [
+            item
+            for item in self.items()
+            if isinstance(item, rect_item_class) and not item.is_suggestion
+        ]
+        if not box_items:
+            logger_gui.debug("get_all_annotations found 0 valid annotation items.")
+            return []
+
+        # Map every box to pixel space, then clamp/filter all of them in one pass
+        to_pixel = self._scene_to_pixel
+        coords = np.empty((len(box_items), 4), dtype=np.float64)
+        for i, item in enumerate(box_items):
+            r = to_pixel.mapRect(item.sceneBoundingRect())
+            coords[i] = (r.left(), r.top(), r.right(), r.bottom())
+        x1 = np.maximum(coords[:, 0], 0.0)
+        y1 = np.maximum(coords[:, 1], 0.0)
+        pw = np.minimum(coords[:, 2], float(img_w)) - x1
+        ph = np.minimum(coords[:, 3], float(img_h)) - y1
+        valid = ((pw >= 1.0) & (ph >= 1.0)).tolist()
+        rects = np.stack((x1, y1, pw, ph), axis=1).round().astype(int).tolist()
+
+        annotations = [
+            {"rect": rect, "class": item.class_label}
+            for item, rect, ok in zip(box_items, rects, valid)
+            if ok
+        ]
+        skipped = len(box_items) - len(annotations)
+        if skipped:
+            logger_gui.warning(
+                f"Skipped {skipped} item(s) with invalid pixel coords (w or h < 1)."
+            )
         logger_gui.debug(
             f"get_all_annotations found {len(annotations)} valid annotation items."
         )
@@ -1030,13 +1192,34 @@ class AnnotatorGraphicsView(QGraphicsView):
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setStyleSheet("background-color: #333333; border: 1px solid #555;")
-        self.setViewportUpdateMode(
-            QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate
-        )
+        if self._try_enable_opengl():
+            # A GL viewport redraws the whole frame anyway; skip update-region bookkeeping
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            )
+        else:
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate
+            )
         logger_gui.info(
             f"Graphics Viewport Update Mode set to: {self.viewportUpdateMode().name}"
         )
 
+    def _try_enable_opengl(self):
+        """Swaps in a QOpenGLWidget viewport if enabled in config and available."""
+        if not getattr(config, "USE_OPENGL_VIEWPORT", False):
+            return False
+        if QOpenGLWidget is None:
+            logger_gui.info("QOpenGLWidget unavailable. Using raster viewport.")
+            return False
+        try:
+            self.setViewport(QOpenGLWidget())
+            logger_gui.info("Graphics view using OpenGL viewport.")
+            return True
+        except Exception as e:
+            logger_gui.warning(f"OpenGL viewport failed ({e}). Using raster viewport.")
+            return False
+
     def wheelEvent(self, event):
         zoom_in_factor = 1.15
         zoom_out_factor = 1 / zoom_in_factor
@@ -1072,7 +1255,11 @@ class AnnotatorGraphicsView(QGraphicsView):
             super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
-        if event.button() == Qt.MouseButton.MiddleButton:
+        # Only a release that ends a middle-button pan needs the synthetic left release
+        if (
+            event.button() == Qt.MouseButton.MiddleButton
+            and self.dragMode() == QGraphicsView.DragMode.ScrollHandDrag
+        ):
             fake_event = QMouseEvent(
                 event.type(),
                 event.position(),
@@ -1089,6 +1276,8 @@ class AnnotatorGraphicsView(QGraphicsView):
 
 # --- SettingsDialog Class (No changes needed) ---
 class SettingsDialog(QDialog):
+    _CONF_KEY = config.SETTING_KEYS.get("confidence_threshold")
+
     def __init__(self, state, parent=None):
         super().__init__(parent)
         if not state or not hasattr(state, "get_setting"):
@@ -1110,10 +1299,9 @@ class SettingsDialog(QDialog):
         default_conf = config.DEFAULT_CONFIDENCE_THRESHOLD
         current_conf = default_conf
         if self.state:
-            conf_key = config.SETTING_KEYS.get("confidence_threshold")
             current_conf = (
-                self.state.get_setting(conf_key, default_conf)
-                if conf_key
+                self.state.get_setting(self._CONF_KEY, default_conf)
+                if self._CONF_KEY
                 else default_conf
             )
         self.conf_thresh_spin.setValue(current_conf)
@@ -1138,9 +1326,8 @@ class SettingsDialog(QDialog):
             super().reject()
             return
         try:
-            conf_key = config.SETTING_KEYS.get("confidence_threshold")
-            if conf_key and hasattr(self.state, "set_setting"):
-                self.state.set_setting(conf_key, self.conf_thresh_spin.value())
+            if self._CONF_KEY and hasattr(self.state, "set_setting"):
+                self.state.set_setting(self._CONF_KEY, self.conf_thresh_spin.value())
                 logger_gui.info("Legacy settings updated via dialog.")
                 super().accept()
             else:
@@ -1157,6 +1344,126 @@ class SettingsDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Could not save settings: {e}")
 
 
+def _load_results_columns(csv_path, columns):
+    """
+    Reads the requested numeric columns of an Ultralytics results.csv.
+    Returns {column: float32 array} for the columns present in the header,
+    or None if the file has no header.
+    """
+    with open(csv_path, newline="") as f:
+        header = [h.strip() for h in next(csv.reader(f), [])]
+    if not header:
+        return None
+    logger_gui.debug(f"CSV Columns found: {header}")
+    found = [c for c in columns if c in header]
+    if not found:
+        return {}
+    try:
+        data = np.loadtxt(
+            csv_path,
+            delimiter=",",
+            skiprows=1,
+            usecols=[header.index(c) for c in found],
+            dtype=np.float32,
+            ndmin=2,
+        )
+    except ValueError as e:
+        # Blank or non-numeric cells: let pandas parse them as NaN
+        import pandas as pd
+
+        logger_gui.debug(f"numpy parse of {csv_path} failed ({e}); using pandas.")
+        # Reuse the stripped header so pandas only materialises the wanted columns
+        dataframe = pd.read_csv(
+            csv_path,
+            header=0,
+            names=header,
+            usecols=found,
+            engine="c",
+            dtype=np.float32,
+        )
+        return {c: dataframe[c].to_numpy() for c in found}
+    if data.size == 0:
+        # Header but no epochs yet: loadtxt gives one empty column whatever usecols was
+        return {c: np.empty(0, dtype=np.float32) for c in found}
+    return {c: data[:, i] for i, c in enumerate(found)}
+
+
+@functools.lru_cache(maxsize=16)
+def _is_dir_cached(path):
+    """os.path.isdir memoised per run path; cleared when the dashboard opens or applies settings."""
+    return os.path.isdir(path)
+
+
+def _load_run_results(run_dir_path, columns):
+    """Loads results.csv from a run directory. Returns (results, display_message)."""
+    display_message = None
+    results = None
+    if run_dir_path and _is_dir_cached(run_dir_path):
+        csv_path = os.path.join(run_dir_path, "results.csv")
+        if os.path.exists(csv_path):
+            try:
+                results = _load_results_columns(csv_path, columns)
+                if results is None:
+                    display_message = "results.csv is empty."
+                    logger_gui.warning(f"Empty results.csv found in {run_dir_path}")
+                else:
+                    logger_gui.info(f"Loaded results.csv from {run_dir_path}")
+            except FileNotFoundError:
+                display_message = "results.csv not found."
+                logger_gui.warning(f"results.csv not found at {csv_path} (unexpected).")
+            except Exception as e:
+                display_message = f"Error reading CSV:\n{e}"
+                logger_gui.error(
+                    f"Error reading {csv_path}: {e}\n{traceback.format_exc()}"
+                )
+        else:
+            display_message = "results.csv not found in run directory."
+            logger_gui.warning(f"results.csv not found in {run_dir_path}")
+    elif run_dir_path:
+        display_message = "Invalid run directory path provided."
+        logger_gui.warning(
+            f"Invalid run directory path provided to update_graph: {run_dir_path}"
+        )
+    else:
+        display_message = "No training run data available to display."
+        logger_gui.info("No run directory path provided for plotting.")
+    return results, display_message
+
+
+def _downsample_results(results, max_points):
+    """Samples every column down to max_points evenly spaced rows, keeping first and last epoch."""
+    n = min((len(v) for v in results.values()), default=0)
+    if n <= max_points:
+        return results
+    idx = np.linspace(0, n - 1, max_points).astype(np.intp)
+    return {c: v[idx] for c, v in results.items()}
+
+
+class _ResultsLoaderSignals(QObject):
+    # serial, run_dir_path, results dict (or None), display message (or None)
+    loaded = pyqtSignal(int, object, object, object)
+
+
+class _ResultsLoader(QRunnable):
+    """Reads results.csv off the GUI thread and hands the arrays back via a signal."""
+
+    def __init__(self, serial, run_dir_path, columns, signals):
+        super().__init__()
+        self.serial = serial
+        self.run_dir_path = run_dir_path
+        self.columns = columns
+        self.signals = signals
+
+    def run(self):
+        results, display_message = _load_run_results(self.run_dir_path, self.columns)
+        try:
+            self.signals.loaded.emit(
+                self.serial, self.run_dir_path, results, display_message
+            )
+        except RuntimeError:
+            pass  # Dashboard (and its signals object) was closed meanwhile
+
+
 # --- TrainingDashboard Class (MODIFIED) ---
 class TrainingDashboard(QDialog):
     DARK_BG_COLOR = "#2E2E2E"
@@ -1165,6 +1472,45 @@ class TrainingDashboard(QDialog):
     MAP_COLOR = "#00FFFF"
     LOSS_COLOR_TRAIN = "#FFA500"
     LOSS_COLOR_VAL = "#FF00FF"
+    # results.csv columns plotted by update_graph
+    EPOCH_COL = "epoch"
+    MAP_COL = "metrics/mAP50-95(B)"  # Common mAP metric
+    TRAIN_LOSS_COL = "train/box_loss"  # Training box loss
+    VAL_LOSS_COL = "val/box_loss"  # Validation box loss
+    GRAPH_UPDATE_DEBOUNCE_MS = 80
+    MAX_PLOT_POINTS = 500  # Longer runs are strided down before plotting
+    FIGURE_DPI = 90
+
+    # Dashboard settings: short name -> default, and short name -> stored key.
+    # Resolved once at class definition instead of per read/write.
+    _SETTING_DEFAULTS = {
+        "epochs_20": config.DEFAULT_EPOCHS_20,
+        "lr_20": config.DEFAULT_LR_20,
+        "epochs_100": config.DEFAULT_EPOCHS_100,
+        "lr_100": config.DEFAULT_LR_100,
+        "training.trigger_20_enabled": config.DEFAULT_TRAIN_TRIGGER_20_ENABLED,
+        "training.trigger_100_enabled": config.DEFAULT_TRAIN_TRIGGER_100_ENABLED,
+        "aug_flipud": config.DEFAULT_AUG_FLIPUD,
+        "aug_fliplr": config.DEFAULT_AUG_FLIPLR,
+        "aug_degrees": config.DEFAULT_AUG_DEGREES,
+    }
+    _KEY_MAP = {
+        name: config.SETTING_KEYS[name]
+        for name in _SETTING_DEFAULTS
+        if name in config.SETTING_KEYS
+    }
+    # Spin boxes: (attribute, setting name, label, min, max, decimals or None for int, step)
+    _TRAINING_SPINS = (
+        ("epochs_20_spin", "epochs_20", "Epochs (20 Img Trigger):", 1, 1000, None, None),
+        ("lr_20_spin", "lr_20", "Learning Rate (20 Img):", 0.000001, 0.1, 6, 0.0001),
+        ("epochs_100_spin", "epochs_100", "Epochs (100 Img Trigger):", 1, 1000, None, None),
+        ("lr_100_spin", "lr_100", "Learning Rate (100 Img):", 0.000001, 0.1, 6, 0.0001),
+    )
+    _AUG_SPINS = (
+        ("flipud_spin", "aug_flipud", "Vertical Flip Prob:", 0.0, 1.0, 2, 0.05),
+        ("fliplr_spin", "aug_fliplr", "Horizontal Flip Prob:", 0.0, 1.0, 2, 0.05),
+        ("degrees_spin", "aug_degrees", "Rotation Degrees (+/-):", 0.0, 180.0, 1, 5.0),
+    )
 
     def __init__(self, state_manager, parent=None):
         super().__init__(parent)
@@ -1186,42 +1532,27 @@ class TrainingDashboard(QDialog):
         )  # MODIFIED: Group title
         param_layout = QFormLayout(param_group)
 
-        # Helper function to safely get settings
-        def _get_setting(key_name, default_val):
-            if not self.state_manager:
-                return default_val
-            key = config.SETTING_KEYS.get(key_name)
-            return (
-                self.state_manager.get_setting(key, default_val)
-                if key and hasattr(self.state_manager, "get_setting")
-                else default_val
+        # Fetch every dashboard setting in one pass
+        stored = {}
+        if self.state_manager and hasattr(self.state_manager, "get_many"):
+            stored = self.state_manager.get_many(
+                list(self._KEY_MAP.values()),
+                {
+                    key: self._SETTING_DEFAULTS[name]
+                    for name, key in self._KEY_MAP.items()
+                },
             )
+        elif self.state_manager:
+            stored = {
+                key: self.state_manager.get_setting(key, self._SETTING_DEFAULTS[name])
+                for name, key in self._KEY_MAP.items()
+            }
+
+        def _get_setting(key_name, default_val):
+            return stored.get(self._KEY_MAP.get(key_name), default_val)
 
         # -- Epochs and Learning Rate Inputs --
-        self.epochs_20_spin = QSpinBox()
-        self.epochs_20_spin.setRange(1, 1000)
-        self.epochs_20_spin.setValue(
-            _get_setting("epochs_20", config.DEFAULT_EPOCHS_20)
-        )
-        param_layout.addRow("Epochs (20 Img Trigger):", self.epochs_20_spin)
-        self.lr_20_spin = QDoubleSpinBox()
-        self.lr_20_spin.setRange(0.000001, 0.1)
-        self.lr_20_spin.setDecimals(6)
-        self.lr_20_spin.setSingleStep(0.0001)
-        self.lr_20_spin.setValue(_get_setting("lr_20", config.DEFAULT_LR_20))
-        param_layout.addRow("Learning Rate (20 Img):", self.lr_20_spin)
-        self.epochs_100_spin = QSpinBox()
-        self.epochs_100_spin.setRange(1, 1000)
-        self.epochs_100_spin.setValue(
-            _get_setting("epochs_100", config.DEFAULT_EPOCHS_100)
-        )
-        param_layout.addRow("Epochs (100 Img Trigger):", self.epochs_100_spin)
-        self.lr_100_spin = QDoubleSpinBox()
-        self.lr_100_spin.setRange(0.000001, 0.1)
-        self.lr_100_spin.setDecimals(6)
-        self.lr_100_spin.setSingleStep(0.0001)
-        self.lr_100_spin.setValue(_get_setting("lr_100", config.DEFAULT_LR_100))
-        param_layout.addRow("Learning Rate (100 Img):", self.lr_100_spin)
+        self._add_spin_rows(param_layout, self._TRAINING_SPINS, _get_setting)
 
         # --- <<< ADDED: Training Trigger Checkboxes >>> ---
         param_layout.addRow(
@@ -1251,35 +1582,35 @@ class TrainingDashboard(QDialog):
 
         # -- Augmentation Inputs --
         param_layout.addRow(QLabel("--- Augmentations ---"))
-        self.flipud_spin = QDoubleSpinBox()
-        self.flipud_spin.setRange(0.0, 1.0)
-        self.flipud_spin.setDecimals(2)
-        self.flipud_spin.setSingleStep(0.05)
-        self.flipud_spin.setValue(_get_setting("aug_flipud", config.DEFAULT_AUG_FLIPUD))
-        param_layout.addRow("Vertical Flip Prob:", self.flipud_spin)
-        self.fliplr_spin = QDoubleSpinBox()
-        self.fliplr_spin.setRange(0.0, 1.0)
-        self.fliplr_spin.setDecimals(2)
-        self.fliplr_spin.setSingleStep(0.05)
-        self.fliplr_spin.setValue(_get_setting("aug_fliplr", config.DEFAULT_AUG_FLIPLR))
-        param_layout.addRow("Horizontal Flip Prob:", self.fliplr_spin)
-        self.degrees_spin = QDoubleSpinBox()
-        self.degrees_spin.setRange(0.0, 180.0)
-        self.degrees_spin.setDecimals(1)
-        self.degrees_spin.setSingleStep(5.0)
-        self.degrees_spin.setValue(
-            _get_setting("aug_degrees", config.DEFAULT_AUG_DEGREES)
-        )
-        param_layout.addRow("Rotation Degrees (+/-):", self.degrees_spin)
+        self._add_spin_rows(param_layout, self._AUG_SPINS, _get_setting)
 
         layout.addWidget(param_group)
+        # Apply only writes values that differ from what was last loaded/applied
+        self._applied_values = self._collect_values()
 
         # --- Training Results Graph Group ---
         results_group = QGroupBox("Latest Training Run Results (from results.csv)")
         results_layout = QVBoxLayout(results_group)
-        self.figure = plt.figure()
+        # Deferred so the main window doesn't pay for matplotlib at startup.
+        # A bare Figure skips pyplot's backend probing and global figure registry.
+        from matplotlib.figure import Figure
+
+        # Use the unified Qt-based canvas (works for Qt5 or Qt6) in Matplotlib 3.7+:
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+
+        # Fixed DPI: the canvas' device-pixel-ratio scaling already covers HiDPI
+        self.figure = Figure(dpi=self.FIGURE_DPI)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setMinimumSize(550, 350)
+        self._init_plot()
+        self._load_serial = 0
+        self._loader_signals = _ResultsLoaderSignals(self)
+        self._loader_signals.loaded.connect(self._render_results)
+        self._pending_run_dir = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.GRAPH_UPDATE_DEBOUNCE_MS)
+        self._update_timer.timeout.connect(self._do_update_graph)
         results_layout.addWidget(self.canvas)
         self.open_folder_button = QPushButton("Open Last Run Folder")
         self.open_folder_button.clicked.connect(self.open_last_run_folder)
@@ -1305,7 +1636,138 @@ class TrainingDashboard(QDialog):
                 False
             )
 
+    def _init_plot(self):
+        """Builds the axes, line artists and message text once; update_graph only feeds them data."""
+        self.figure.patch.set_facecolor(self.DARK_BG_COLOR)
+        self.ax = self.figure.add_subplot(111)
+        self.ax2 = self.ax.twinx()
+        for axis in (self.ax, self.ax2):
+            axis.set_facecolor(self.DARK_BG_COLOR)
+            axis.tick_params(axis="y", labelcolor=self.LIGHT_TEXT_COLOR)
+            for spine in axis.spines.values():
+                spine.set_edgecolor(self.GRID_COLOR)
+        self.ax.set_xlabel("Epoch", color=self.LIGHT_TEXT_COLOR)
+        self.ax.set_ylabel("mAP 50-95", color=self.LIGHT_TEXT_COLOR)
+        self.ax.set_title("Training Metrics", color=self.LIGHT_TEXT_COLOR, fontsize=12)
+        self.ax.grid(True, color=self.GRID_COLOR, linestyle=":", linewidth=0.5)
+        self.ax.tick_params(axis="x", colors=self.LIGHT_TEXT_COLOR)
+        self.ax2.set_ylabel("Loss", color=self.LIGHT_TEXT_COLOR)
+
+        (self.line_map,) = self.ax.plot(
+            [],
+            [],
+            color=self.MAP_COLOR,
+            marker="o",
+            linestyle="-",
+            linewidth=1.5,
+            markersize=4,
+            label="mAP50-95",
+            animated=True,
+            rasterized=True,
+        )
+        (self.line_train,) = self.ax2.plot(
+            [],
+            [],
+            color=self.LOSS_COLOR_TRAIN,
+            marker=".",
+            linestyle="--",
+            linewidth=1,
+            markersize=3,
+            label="Train Loss (Box)",
+            animated=True,
+            rasterized=True,
+        )
+        (self.line_val,) = self.ax2.plot(
+            [],
+            [],
+            color=self.LOSS_COLOR_VAL,
+            marker=".",
+            linestyle=":",
+            linewidth=1,
+            markersize=3,
+            label="Val Loss (Box)",
+            animated=True,
+            rasterized=True,
+        )
+
+        # Shown in place of the axes when there is nothing to plot
+        self.message_text = self.figure.text(
+            0.5,
+            0.5,
+            "",
+            ha="center",
+            va="center",
+            color=self.LIGHT_TEXT_COLOR,
+            fontsize=10,
+            wrap=True,
+            visible=False,
+        )
+
+        # Lines are animated: full draws render everything else, which is
+        # cached here so data-only refreshes can blit the lines on top
+        self._background = None
+        self._background_key = None
+        self._layout_key = None  # Axes visibility tight_layout last ran for
+        self._legend_signature = None  # Entries of the installed legend
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+
+    def _plot_state_key(self):
+        """Everything baked into the cached background besides the lines."""
+        return (
+            self.ax.get_visible(),
+            self.ax2.get_visible(),
+            self.ax.get_xlim(),
+            self.ax.get_ylim(),
+            self.ax2.get_ylim(),
+            self.ax.get_position().bounds,
+        )
+
+    def _on_canvas_draw(self, event):
+        """Captures the background after a full draw (including resizes) and adds the lines."""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._background_key = self._plot_state_key()
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for line in (self.line_map, self.line_train, self.line_val):
+            if line.axes.get_visible():
+                line.axes.draw_artist(line)
+
+    def _update_legend(self, show_loss):
+        """Places the legend on the top-most visible axes (rebuilt only when its entries change)."""
+        lines = (
+            [self.line_map, self.line_train, self.line_val]
+            if show_loss
+            else [self.line_map]
+        )
+        labels = [line.get_label() for line in lines]
+        signature = tuple(labels)
+        if signature == self._legend_signature:
+            return  # Same entries: keep the installed legend ("best" loc re-resolves at draw)
+        self._legend_signature = signature
+        if show_loss:
+            if self.ax.get_legend():
+                self.ax.get_legend().remove()
+            self.ax2.legend(
+                lines,
+                labels,
+                loc="best",
+                fontsize="small",
+                frameon=False,
+                labelcolor=self.LIGHT_TEXT_COLOR,
+            )
+        else:
+            if self.ax2.get_legend():
+                self.ax2.get_legend().remove()
+            self.ax.legend(
+                loc="best",
+                fontsize="small",
+                frameon=False,
+                labelcolor=self.LIGHT_TEXT_COLOR,
+            )
+
     def load_initial_graph(self):
+        _is_dir_cached.cache_clear()  # Runs may have been added/removed since last open
         last_run_dir = None
         if self.state_manager and hasattr(self.state_manager, "get_last_run_path"):
             try:
@@ -1317,10 +1779,56 @@ class TrainingDashboard(QDialog):
             logger_gui.warning("State manager or 'get_last_run_path' unavailable.")
         self.update_graph(last_run_dir)
 
+    def done(self, result):
+        """Releases the figure and canvas when the dashboard closes (Close button or window X)."""
+        self._update_timer.stop()
+        self._load_serial += 1  # Drop any CSV load still in flight
+        try:
+            self._background = None
+            self.figure.clear()
+            self.canvas.deleteLater()
+        except Exception as e:
+            logger_gui.debug(f"Error releasing dashboard figure: {e}")
+        super().done(result)
+        # Parented to the main window, so without this every open would stay alive
+        self.deleteLater()
+
+    def _add_spin_rows(self, form_layout, specs, get_setting):
+        """Creates one spin box per spec row, stores it on self and adds it to the form."""
+        for attr, name, label, minimum, maximum, decimals, step in specs:
+            if decimals is None:
+                spin = QSpinBox()
+            else:
+                spin = QDoubleSpinBox()
+                spin.setDecimals(decimals)
+            spin.setRange(minimum, maximum)
+            if step is not None:
+                spin.setSingleStep(step)
+            spin.setValue(get_setting(name, self._SETTING_DEFAULTS[name]))
+            setattr(self, attr, spin)
+            form_layout.addRow(label, spin)
+
+    def _collect_values(self):
+        """Current widget values keyed by short setting name."""
+        return {
+            "epochs_20": self.epochs_20_spin.value(),
+            "lr_20": self.lr_20_spin.value(),
+            "epochs_100": self.epochs_100_spin.value(),
+            "lr_100": self.lr_100_spin.value(),
+            # --- <<< ADDED: Save Training Trigger Settings >>> ---
+            "training.trigger_20_enabled": self.trigger_20_checkbox.isChecked(),
+            "training.trigger_100_enabled": self.trigger_100_checkbox.isChecked(),
+            # --- <<< END ADDED >>> ---
+            "aug_flipud": self.flipud_spin.value(),
+            "aug_fliplr": self.fliplr_spin.value(),
+            "aug_degrees": self.degrees_spin.value(),
+        }
+
     def apply_settings(self):
         if not self.state_manager:
             logger_gui.error("Apply settings ignored: Invalid state manager.")
             return
+        _is_dir_cached.cache_clear()  # runs_dir may have changed
         if not hasattr(self.state_manager, "set_setting"):
             logger_gui.error(
                 "Apply settings failed: State manager missing 'set_setting'."
@@ -1328,31 +1836,32 @@ class TrainingDashboard(QDialog):
             QMessageBox.critical(self, "Internal Error", "Cannot save settings.")
             return
 
-        def _set_setting(key_name, value):
-            key = config.SETTING_KEYS.get(key_name)
-            if key:
-                self.state_manager.set_setting(key, value)
-            else:
-                logger_gui.error(
-                    f"Configuration key '{key_name}' not found in config.SETTING_KEYS."
-                )
+        values = self._collect_values()
+        changed = {
+            name: value
+            for name, value in values.items()
+            if self._applied_values.get(name) != value
+        }
+        if not changed:
+            logger_gui.debug("Apply settings: no dashboard values changed.")
+            return
 
         try:
-            _set_setting("epochs_20", self.epochs_20_spin.value())
-            _set_setting("lr_20", self.lr_20_spin.value())
-            _set_setting("epochs_100", self.epochs_100_spin.value())
-            _set_setting("lr_100", self.lr_100_spin.value())
-            # --- <<< ADDED: Save Training Trigger Settings >>> ---
-            _set_setting(
-                "training.trigger_20_enabled", self.trigger_20_checkbox.isChecked()
-            )
-            _set_setting(
-                "training.trigger_100_enabled", self.trigger_100_checkbox.isChecked()
-            )
-            # --- <<< END ADDED >>> ---
-            _set_setting("aug_flipud", self.flipud_spin.value())
-            _set_setting("aug_fliplr", self.fliplr_spin.value())
-            _set_setting("aug_degrees", self.degrees_spin.value())
+            updates = {}
+            for key_name, value in changed.items():
+                key = self._KEY_MAP.get(key_name)
+                if key:
+                    updates[key] = value
+                else:
+                    logger_gui.error(
+                        f"Configuration key '{key_name}' not found in config.SETTING_KEYS."
+                    )
+            if hasattr(self.state_manager, "set_many"):
+                self.state_manager.set_many(updates)  # One save for the whole batch
+            else:
+                for key, value in updates.items():
+                    self.state_manager.set_setting(key, value)
+            self._applied_values = values
             logger_gui.info(
                 "Training/augmentation/trigger params applied via dashboard."
             )
@@ -1369,7 +1878,7 @@ class TrainingDashboard(QDialog):
                 last_run_path = self.state_manager.get_last_run_path()
             except Exception as e:
                 logger_gui.error(f"Error calling get_last_run_path: {e}")
-        if last_run_path and os.path.isdir(last_run_path):
+        if last_run_path and _is_dir_cached(last_run_path):
             try:
                 logger_gui.info(f"Opening training run folder: {last_run_path}")
                 QDesktopServices.openUrl(QUrl.fromLocalFile(last_run_path))
@@ -1391,135 +1900,66 @@ class TrainingDashboard(QDialog):
 
     def update_graph(self, run_dir_path):
         """Updates the Matplotlib graph using data from results.csv in the specified run directory."""
+        # Bursts of requests (repeated Apply, run-completed callbacks) collapse into one load
+        self._pending_run_dir = run_dir_path
+        self._update_timer.start()
+
+    def _do_update_graph(self):
+        run_dir_path = self._pending_run_dir
         logger_gui.debug(f"Dashboard updating graph from: {run_dir_path}")
-        self.figure.clear()
-        self.figure.patch.set_facecolor(self.DARK_BG_COLOR)
-        ax = self.figure.add_subplot(111)
-        ax.set_facecolor(self.DARK_BG_COLOR)
-
-        display_message = None
-        dataframe = None
-
-        # --- Load Data ---
-        if run_dir_path and os.path.isdir(run_dir_path):
-            csv_path = os.path.join(run_dir_path, "results.csv")
-            if os.path.exists(csv_path):
-                try:
-                    dataframe = pd.read_csv(csv_path)
-                    dataframe.columns = dataframe.columns.str.strip()
-                    logger_gui.info(f"Loaded results.csv from {run_dir_path}")
-                    logger_gui.debug(f"CSV Columns found: {list(dataframe.columns)}")
-                except pd.errors.EmptyDataError:
-                    display_message = "results.csv is empty."
-                    logger_gui.warning(f"Empty results.csv found in {run_dir_path}")
-                except FileNotFoundError:
-                    display_message = "results.csv not found."
-                    logger_gui.warning(
-                        f"results.csv not found at {csv_path} (unexpected)."
-                    )
-                except Exception as e:
-                    display_message = f"Error reading CSV:\n{e}"
-                    logger_gui.error(
-                        f"Error reading {csv_path}: {e}\n{traceback.format_exc()}"
-                    )
-            else:
-                display_message = "results.csv not found in run directory."
-                logger_gui.warning(f"results.csv not found in {run_dir_path}")
-        elif run_dir_path:
-            display_message = "Invalid run directory path provided."
-            logger_gui.warning(
-                f"Invalid run directory path provided to update_graph: {run_dir_path}"
+        # The CSV is read on the global thread pool; only the newest request is drawn
+        self._load_serial += 1
+        QThreadPool.globalInstance().start(
+            _ResultsLoader(
+                self._load_serial,
+                run_dir_path,
+                (self.EPOCH_COL, self.MAP_COL, self.TRAIN_LOSS_COL, self.VAL_LOSS_COL),
+                self._loader_signals,
             )
-        else:
-            display_message = "No training run data available to display."
-            logger_gui.info("No run directory path provided for plotting.")
+        )
+
+    def _render_results(self, serial, run_dir_path, results, display_message):
+        """Plots arrays loaded by _ResultsLoader (runs on the GUI thread)."""
+        if serial != self._load_serial:
+            logger_gui.debug(f"Dropping stale results for {run_dir_path}")
+            return
+        self.message_text.set_color(self.LIGHT_TEXT_COLOR)
+        if results:
+            results = _downsample_results(results, self.MAX_PLOT_POINTS)
 
         # --- Plot Data ---
         plot_success = False
-        if dataframe is not None:
+        if results is not None:
             try:
-                epoch_col = "epoch"
-                map_col = "metrics/mAP50-95(B)"  # Common mAP metric
-                val_loss_col = "val/box_loss"  # Validation box loss
-                train_loss_col = "train/box_loss"  # Training box loss
+                epoch_col = self.EPOCH_COL
+                map_col = self.MAP_COL
+                val_loss_col = self.VAL_LOSS_COL
+                train_loss_col = self.TRAIN_LOSS_COL
 
                 required_cols = [epoch_col, map_col]
-                if not all(col in dataframe.columns for col in required_cols):
-                    missing = [c for c in required_cols if c not in dataframe.columns]
+                if not all(col in results for col in required_cols):
+                    missing = [c for c in required_cols if c not in results]
                     raise KeyError(
                         f"Missing required columns in results.csv: {missing}"
                     )
 
-                ax.plot(
-                    dataframe[epoch_col],
-                    dataframe[map_col],
-                    color=self.MAP_COLOR,
-                    marker="o",
-                    linestyle="-",
-                    linewidth=1.5,
-                    markersize=4,
-                    label="mAP50-95",
-                )
-                ax.set_ylabel("mAP 50-95", color=self.LIGHT_TEXT_COLOR)
-                ax.tick_params(axis="y", labelcolor=self.LIGHT_TEXT_COLOR)
+                self.line_map.set_data(results[epoch_col], results[map_col])
 
                 plot_loss = True  # Flag to enable loss plotting
                 loss_cols_exist = all(
-                    col in dataframe.columns for col in [val_loss_col, train_loss_col]
+                    col in results for col in [val_loss_col, train_loss_col]
                 )
-                if plot_loss and loss_cols_exist:
-                    ax2 = ax.twinx()
-                    ax2.plot(
-                        dataframe[epoch_col],
-                        dataframe[train_loss_col],
-                        color=self.LOSS_COLOR_TRAIN,
-                        marker=".",
-                        linestyle="--",
-                        linewidth=1,
-                        markersize=3,
-                        label="Train Loss (Box)",
-                    )
-                    ax2.plot(
-                        dataframe[epoch_col],
-                        dataframe[val_loss_col],
-                        color=self.LOSS_COLOR_VAL,
-                        marker=".",
-                        linestyle=":",
-                        linewidth=1,
-                        markersize=3,
-                        label="Val Loss (Box)",
-                    )
-                    ax2.set_ylabel("Loss", color=self.LIGHT_TEXT_COLOR)
-                    ax2.tick_params(axis="y", labelcolor=self.LIGHT_TEXT_COLOR)
-                    lines, labels = ax.get_legend_handles_labels()
-                    lines2, labels2 = ax2.get_legend_handles_labels()
-                    ax2.legend(
-                        lines + lines2,
-                        labels + labels2,
-                        loc="best",
-                        fontsize="small",
-                        frameon=False,
-                        labelcolor=self.LIGHT_TEXT_COLOR,
-                    )
-                    for spine in ax2.spines.values():
-                        spine.set_edgecolor(self.GRID_COLOR)
-                elif ax.get_legend_handles_labels()[1]:
-                    ax.legend(
-                        loc="best",
-                        fontsize="small",
-                        frameon=False,
-                        labelcolor=self.LIGHT_TEXT_COLOR,
-                    )
-
-                ax.set_xlabel("Epoch", color=self.LIGHT_TEXT_COLOR)
-                ax.set_title(
-                    "Training Metrics", color=self.LIGHT_TEXT_COLOR, fontsize=12
-                )
-                ax.grid(True, color=self.GRID_COLOR, linestyle=":", linewidth=0.5)
-                ax.tick_params(axis="x", colors=self.LIGHT_TEXT_COLOR)
-                for spine in ax.spines.values():
-                    spine.set_edgecolor(self.GRID_COLOR)
-
+                show_loss = plot_loss and loss_cols_exist
+                if show_loss:
+                    self.line_train.set_data(results[epoch_col], results[train_loss_col])
+                    self.line_val.set_data(results[epoch_col], results[val_loss_col])
+                    self.ax2.relim()
+                    self.ax2.autoscale_view()
+                self.ax2.set_visible(show_loss)
+                self._update_legend(show_loss)
+
+                self.ax.relim()
+                self.ax.autoscale_view()
                 plot_success = True
             except KeyError as e:
                 display_message = f"Missing expected column in results.csv:\n{e}"
@@ -1531,39 +1971,48 @@ class TrainingDashboard(QDialog):
                 )
 
         # --- Display Message on Failure ---
+        self.ax.set_visible(plot_success)
         if not plot_success:
-            ax.text(
-                0.5,
-                0.5,
-                display_message or "Unknown error plotting data",
-                ha="center",
-                va="center",
-                color=self.LIGHT_TEXT_COLOR,
-                fontsize=10,
-                wrap=True,
-                transform=ax.transAxes,
+            self.ax2.set_visible(False)
+            self.message_text.set_text(
+                display_message or "Unknown error plotting data"
             )
-            ax.axis("off")
+        self.message_text.set_visible(not plot_success)
 
         # --- Final Canvas Draw ---
         try:
-            self.figure.tight_layout()
-            self.canvas.draw()
-            logger_gui.debug("Dashboard canvas redrawn after plotting attempt.")
+            # Layout only depends on which axes are shown, not on the data
+            layout_key = (self.ax.get_visible(), self.ax2.get_visible())
+            if layout_key != self._layout_key:
+                self.figure.tight_layout()
+                self._layout_key = layout_key
+            if (
+                plot_success
+                and self._background is not None
+                and self._plot_state_key() == self._background_key
+            ):
+                # Axes, ticks and legend unchanged: repaint only the lines
+                self.canvas.restore_region(self._background)
+                self._draw_lines()
+                self.canvas.blit(self.figure.bbox)
+                logger_gui.debug("Dashboard lines blitted onto cached background.")
+            else:
+                self.canvas.draw_idle()
+                logger_gui.debug(
+                    "Dashboard canvas redraw scheduled after plotting attempt."
+                )
         except Exception as draw_err:
             logger_gui.error(
                 f"Error finalizing or drawing dashboard canvas: {draw_err}",
                 exc_info=True,
             )
             try:
-                self.figure.clear()
-                ax_err = self.figure.add_subplot(111)
-                ax_err.set_facecolor(self.DARK_BG_COLOR)
-                ax_err.text(
-                    0.5, 0.5, "Canvas Draw Error", ha="center", va="center", color="red"
-                )
-                ax_err.axis("off")
-                self.canvas.draw()
+                self.ax.set_visible(False)
+                self.ax2.set_visible(False)
+                self.message_text.set_text("Canvas Draw Error")
+                self.message_text.set_color("red")
+                self.message_text.set_visible(True)
+                self.canvas.draw_idle()
             except Exception:
                 pass
 
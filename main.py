@@ -3,9 +3,38 @@
 import sys
 import os
 import logging
-import requests  # Ensure 'requests' library is installed (pip install requests)
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QApplication, QMessageBox, QInputDialog
+import logging.handlers
+import queue
+import atexit
+import json
+import time
+import hmac
+import threading
+from urllib.parse import urlsplit
+
+try:
+    from orjson import loads as _json_loads, dumps as _json_dumps  # Optional faster codec
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:
+    import keyring  # Optional: OS credential store for silent re-verification
+except ImportError:
+    keyring = None
+
+from PyQt6.QtCore import (
+    Qt,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QEventLoop,
+    QSettings,
+    pyqtSignal,
+)
+from PyQt6.QtWidgets import QApplication, QMessageBox, QInputDialog, QProgressDialog
 # Removed QSplashScreen imports for simplicity, add back if needed
 
 # --- Import configuration ---
@@ -18,230 +47,589 @@ import config  # Needed for APP_DIR and setting config.TIER
 # --- Backend License Verification URL (ensure this is correct) ---
 BACKEND_VERIFY_URL = "https://snowball-license-backend-frsu.vercel.app/api/verify-license"  # EXAMPLE URL - REPLACE!
 
+# --- Local license cache (kept in QSettings under "license/") ---
+LICENSE_CACHE_TTL_SECONDS = 7 * 24 * 3600  # Re-verify with the backend weekly
+# After expiry, an offline machine keeps its cached tier for this much longer only
+LICENSE_OFFLINE_GRACE_SECONDS = 7 * 24 * 3600
+LICENSE_KEYRING_SERVICE = "SnowballAnnotator"  # OS credential store entry for the key
+# Timeout, rate-limit and server-side failures: worth retrying, never a verdict on the key
+RETRYABLE_STATUS_CODES = frozenset((408, 429, 500, 502, 503, 504))
+# Resolved once at import; APP_DIR doesn't change while the app runs
+LEGACY_FLAG_PATHS = (
+    tuple(
+        os.path.join(config.APP_DIR, name)
+        for name in (".snowball_activated", ".snowball_tier")  # Pre-cache versions
+    )
+    if config.APP_DIR
+    else ()
+)
+LOG_FILE_NAME = "app_debug.log"
+APP_LOG_PATH = os.path.join(config.APP_DIR, LOG_FILE_NAME) if config.APP_DIR else None
+
 # Setup logger for main module
 logger_main = logging.getLogger(__name__)
 
+# Shared HTTP session: keeps the TCP/TLS connection to the backend alive across attempts
+_http_session = None
+_http_session_lock = threading.Lock()  # Pre-warm thread and verify task may race to create it
 
-def verify_license_with_backend():
+
+def _build_retry():
+    """Retry policy for the verify POST: timeouts, 408/429 and 5xx only, exponential backoff."""
+    from urllib3.util.retry import Retry
+
+    retry_args = dict(
+        total=3,
+        connect=3,
+        read=2,
+        status_forcelist=RETRYABLE_STATUS_CODES,
+        allowed_methods=frozenset(["POST"]),  # Verifying a key has no side effects
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Hand back the last response so it can be classified
+    )
+    try:
+        return Retry(backoff_jitter=0.15, **retry_args)
+    except TypeError:  # urllib3 < 2 has no jitter option
+        return Retry(**retry_args)
+
+
+def _get_http_session():
+    """Returns the process-wide requests.Session for backend calls (created on first use)."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            import requests
+
+            session = requests.Session()
+            session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=1, pool_maxsize=4, max_retries=_build_retry()
+                ),
+            )
+            session.headers.update(
+                {
+                    "Content-Type": "application/json",
+                    "User-Agent": f"SnowballAnnotator/{config.VERSION}",
+                }
+            )
+            _http_session = session
+        return _http_session
+
+
+class _BackendSignals(QObject):
+    finished = pyqtSignal(object, object)  # response (or None), exception (or None)
+
+
+class _BackendRequestTask(QRunnable):
+    """Sends one prepared request from the global thread pool so the GUI keeps repainting."""
+
+    def __init__(self, prepared, signals, timeout):
+        super().__init__()
+        self.prepared = prepared
+        self.signals = signals
+        self.timeout = timeout
+
+    def run(self):
+        response, error = None, None
+        try:
+            session = _get_http_session()
+            # send() skips Session.request's env merge, so pick up proxies/CA bundle here
+            env = session.merge_environment_settings(
+                self.prepared.url, {}, None, None, None
+            )
+            response = session.send(self.prepared, timeout=self.timeout, **env)
+        except Exception as e:
+            error = e
+        try:
+            self.signals.finished.emit(response, error)
+        except RuntimeError:
+            pass  # Request was cancelled and the waiting side is gone
+
+
+def _prewarm_backend_connection():
+    """Resolves DNS and completes the TLS handshake while the user is typing the key."""
+    parts = urlsplit(BACKEND_VERIFY_URL)
+    try:
+        _get_http_session().head(f"{parts.scheme}://{parts.netloc}/", timeout=5)
+        logger_main.debug("Backend connection pre-warmed.")
+    except Exception as e:
+        logger_main.debug(f"Backend pre-warm failed (verify will connect itself): {e}")
+
+
+def _backend_reachable(timeout=3):
     """
-    Prompts user if needed and verifies key against the secure backend.
-    Sets config.TIER based on verification result.
+    Quick HEAD to the backend origin, so an offline start fails fast. Uses a plain
+    requests call (no mounted retries) that honours HTTP(S)_PROXY like the verify
+    request does; any HTTP response counts as reachable.
+    """
+    import requests
 
-    Returns:
-        bool: True if license is valid and tier is set, False otherwise.
+    parts = urlsplit(BACKEND_VERIFY_URL)
+    try:
+        requests.head(
+            f"{parts.scheme}://{parts.netloc}/", timeout=timeout, allow_redirects=False
+        ).close()
+        return True
+    except requests.exceptions.RequestException as e:
+        logger_main.info(f"Activation server unreachable: {e}")
+        return False
+
+
+def _send_backend_request(prepared, label, title, timeout=(5, 20)):
+    """
+    Sends a prepared request on the thread pool while a cancellable progress dialog
+    keeps the event loop pumping. Returns the response, or None if the user cancelled.
+    Network exceptions are re-raised on the calling (GUI) thread.
+    Default timeout is (connect, read): a dead network fails fast, a cold backend still gets 20s.
     """
-    activation_flag_file = os.path.join(config.APP_DIR, ".snowball_activated")
-    tier_flag_file = os.path.join(
-        config.APP_DIR, ".snowball_tier"
-    )  # File to store tier
+    result = {}
+    loop = QEventLoop()
+    signals = _BackendSignals()
+
+    def _on_finished(response, error):
+        result["response"] = response
+        result["error"] = error
+        loop.quit()
+
+    signals.finished.connect(_on_finished)
+    progress = QProgressDialog(label, "Cancel", 0, 0)
+    progress.setWindowTitle(title)
+    progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+    progress.setMinimumDuration(0)
+    progress.canceled.connect(loop.quit)
+    progress.show()
+
+    QThreadPool.globalInstance().start(
+        _BackendRequestTask(prepared, signals, timeout)
+    )
+    loop.exec()
+    progress.close()
+
+    if "response" not in result:
+        return None  # Cancelled; the late reply (if any) is ignored
+    if result["error"] is not None:
+        raise result["error"]
+    return result["response"]
+
+
+def _post_verify_request(payload):
+    """Posts the license payload to the backend. Returns the response, or None if cancelled."""
+    import requests
+
+    # Encoded once, compact bytes with a fixed Content-Length: adapter-level retries
+    # resend these exact bytes. The reply is tiny, so skip gzip negotiation.
+    body = _json_dumps(payload)
+    prepared = _get_http_session().prepare_request(
+        requests.Request(
+            "POST",
+            BACKEND_VERIFY_URL,
+            data=body,
+            headers={
+                "Content-Length": str(len(body)),
+                "Accept-Encoding": "identity",
+            },
+        )
+    )
+    return _send_backend_request(
+        prepared, "Verifying license key...", "Activate Snowball Annotation"
+    )
+
+
+def _license_cache_secret(settings, create=False):
+    """
+    Per-install HMAC key, generated once and kept beside the cache (so it is not
+    a secret from anyone who can edit the settings). Deliberately not
+    uuid.getnode(): without a readable MAC it is random per process.
+    """
+    secret = settings.value("license_mac_secret", "", type=str)
+    if not secret and create:
+        secret = os.urandom(32).hex()
+        settings.setValue("license_mac_secret", secret)
+    return secret
+
 
+def _license_cache_mac(fields, secret):
+    """
+    HMAC over the cache fields. Detects corrupted or accidentally edited entries
+    only; it is not tamper-proof, since the key is stored with the data.
+    """
+    message = json.dumps(fields, sort_keys=True, separators=(",", ":")).encode()
+    return hmac.new(bytes.fromhex(secret), message, "sha256").hexdigest()
+
+
+def _license_settings():
+    # Platform-native store (registry / plist / ini); values are cached in-process by Qt
+    return QSettings("Snowball", "Annotator")
+
+
+def _load_license_cache():
+    """Returns the signed cache {tier, expires_at, nonce}, or None if missing/invalid."""
+    settings = _license_settings()
+    if not settings.contains("license/hmac"):
+        return None  # Not activated yet
     try:
-        # Check if BOTH flags exist
-        if os.path.exists(activation_flag_file) and os.path.exists(tier_flag_file):
-            with open(tier_flag_file, "r") as f_tier:
-                cached_tier = f_tier.read().strip().upper()  # Read stored tier
-
-            # Validate the cached tier
-            if cached_tier in ["BASIC", "PRO"]:  # Add "COMMERCIAL" later if needed
-                logger_main.info(
-                    f"Local activation flags found. Skipping prompt. Cached Tier: {cached_tier}"
-                )
-                config.TIER = cached_tier  # <<< SET TIER FROM CACHE
-                return True  # Assume valid if flags exist and tier is known
-            else:
-                logger_main.warning(
-                    f"Invalid tier found in cache file: '{cached_tier}'. Re-verifying."
-                )
-                # Clean up bad flags if tier is invalid
-                try:
-                    if os.path.exists(activation_flag_file):
-                        os.remove(activation_flag_file)
-                    if os.path.exists(tier_flag_file):
-                        os.remove(tier_flag_file)
-                except Exception as rm_err:
-                    logger_main.error(f"Error removing invalid flag files: {rm_err}")
-        elif os.path.exists(activation_flag_file):
-            # If only activation flag exists, something is wrong, force re-verify
+        secret = _license_cache_secret(settings)
+        if not secret:
+            logger_main.warning("License cache has no signing secret. Re-verifying.")
+            return None
+        fields = {
+            "tier": settings.value("license/tier", "", type=str),
+            "expires_at": settings.value("license/expires_at", 0, type=int),
+            "nonce": settings.value("license/nonce", "", type=str),
+        }
+        stored_mac = settings.value("license/hmac", "", type=str)
+        if not hmac.compare_digest(_license_cache_mac(fields, secret), stored_mac):
+            logger_main.warning("License cache signature mismatch. Re-verifying.")
+            return None
+        if fields["tier"] not in ["BASIC", "PRO"]:  # Add "COMMERCIAL" later if needed
             logger_main.warning(
-                "Activation flag found, but tier flag missing. Re-verifying."
+                f"Invalid tier found in license cache: '{fields['tier']}'. Re-verifying."
             )
-            try:
-                os.remove(activation_flag_file)
-            except Exception as rm_err:
-                logger_main.error(f"Error removing activation flag: {rm_err}")
+            return None
+        return fields
+    except Exception as e:
+        logger_main.warning(f"Could not read license cache: {e}")
+        return None
+
+
+def _save_license_cache(tier):
+    """Stores the signed license cache in QSettings. The key itself is never persisted."""
+    fields = {
+        "tier": tier,
+        "expires_at": int(time.time()) + LICENSE_CACHE_TTL_SECONDS,
+        "nonce": os.urandom(8).hex(),
+    }
+    settings = _license_settings()
+    secret = _license_cache_secret(settings, create=True)
+    for name, value in fields.items():
+        settings.setValue(f"license/{name}", value)
+    settings.setValue("license/hmac", _license_cache_mac(fields, secret))
+    settings.remove("license/key")  # Plaintext key written by earlier versions
+    settings.sync()
+    if settings.status() != QSettings.Status.NoError:
+        raise OSError(f"QSettings write failed: {settings.status().name}")
+    # Flag files from older versions are superseded by the signed cache
+    for legacy_path in LEGACY_FLAG_PATHS:
+        try:
+            os.remove(legacy_path)
+        except FileNotFoundError:
+            pass
+
 
+def _load_license_key():
+    """Returns the license key from the OS credential store, or None."""
+    if keyring is None:
+        return None
+    try:
+        return keyring.get_password(LICENSE_KEYRING_SERVICE, "license")
     except Exception as e:
-        logger_main.warning(f"Could not check for activation/tier flags: {e}")
-        # Proceed to online check
+        logger_main.warning(f"Could not read license key from keyring: {e}")
+        return None
 
-    # --- Prompt user and perform ONLINE check if flags don't exist or were invalid ---
-    key, ok = QInputDialog.getText(
-        None, "Activate Snowball Annotation", "Please enter your license key:"
-    )
 
-    if ok and key:
-        key = key.strip()
-        if not key:
-            QMessageBox.warning(
-                None, "License Required", "Please enter a valid license key."
-            )
-            return verify_license_with_backend()  # Re-prompt
+def _store_license_key(key):
+    """Keeps the key in the OS credential store (never in QSettings). Best effort."""
+    if keyring is None:
+        logger_main.info("keyring not installed; key will be prompted for on expiry.")
+        return
+    try:
+        keyring.set_password(LICENSE_KEYRING_SERVICE, "license", key)
+    except Exception as e:
+        logger_main.warning(f"Could not store license key in keyring: {e}")
 
-        logger_main.info(f"Attempting verification for key ending in ...{key[-4:]}")
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
 
-        try:
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": f"SnowballAnnotator/{config.VERSION}",
-            }
-            payload = {"licenseKey": key}
-            logger_main.debug(f"Posting to backend: {BACKEND_VERIFY_URL}")
-            response = requests.post(
-                BACKEND_VERIFY_URL, headers=headers, json=payload, timeout=25
-            )
-            logger_main.debug(f"Backend response status: {response.status_code}")
-            response.raise_for_status()
-            data = response.json()
-            logger_main.debug(f"Backend response data: {data}")
-
-            if data.get("valid") is True:
-                # --- Success! Get the tier ---
-                # Default to BASIC if tier is missing or unknown from backend
-                verified_tier = data.get("tier", "basic").upper()
-                if verified_tier not in ["BASIC", "PRO"]:  # Add "COMMERCIAL" later
-                    logger_main.warning(
-                        f"Received unknown tier '{verified_tier}' from backend. Defaulting to BASIC."
-                    )
-                    verified_tier = "BASIC"
+def _forget_license_key():
+    if keyring is None:
+        return
+    try:
+        keyring.delete_password(LICENSE_KEYRING_SERVICE, "license")
+    except Exception:
+        pass  # Nothing stored, or no usable backend
 
-                config.TIER = verified_tier  # <<< SET TIER FROM BACKEND RESPONSE
-                logger_main.info(f"--- Activated Tier: {config.TIER} ---")
 
-                QApplication.restoreOverrideCursor()
-                QMessageBox.information(
-                    None,
-                    "Activated",
-                    f"Thank you! License verified successfully.\nTier: {verified_tier.capitalize()}",
-                )
+def _clear_license_cache():
+    settings = _license_settings()
+    settings.remove("license")
+    settings.sync()
 
-                # --- Store activation flag AND tier flag ---
-                try:
-                    os.makedirs(config.APP_DIR, exist_ok=True)
-                    with open(activation_flag_file, "w") as f_act:
-                        f_act.write("Activated")  # Simple content
-                    with open(tier_flag_file, "w") as f_tier:
-                        f_tier.write(config.TIER)  # Store the determined tier
-                    logger_main.info(
-                        f"Stored activation and tier flags in {config.APP_DIR}"
-                    )
-                except Exception as e_flag:
-                    logger_main.error(
-                        f"Failed to store activation/tier flags: {e_flag}"
-                    )
-                    # Non-critical, app can proceed but will ask next time
-
-                return True  # Return success
-
-            else:
-                # Backend said invalid
-                error_msg = data.get("error", "Invalid license key reported by server.")
-                logger_main.warning(f"Backend reported invalid key: {error_msg}")
-                QApplication.restoreOverrideCursor()
-                QMessageBox.critical(None, "Invalid Key", f"{error_msg}")
-                # Let main block handle exit
-                return False  # Failed verification
-
-        except requests.exceptions.HTTPError as e:
-            logger_main.error(
-                f"HTTP Error: {e.response.status_code} - {e.response.text}",
-                exc_info=True,
-            )
-            QApplication.restoreOverrideCursor()
-            try:
-                error_detail = e.response.json().get("error", e.response.reason)
-            except:
-                error_detail = (
-                    e.response.reason
-                    if hasattr(e.response, "reason")
-                    else "Unknown HTTP Error"
+
+def _verify_key(key):
+    """
+    Verifies a key against the backend without showing any result dialogs.
+
+    Returns:
+        tuple: (tier, None, None, False) on success, otherwise
+        (None, dialog_title, dialog_message, is_network_problem).
+        dialog_title is None if the user cancelled the request.
+    """
+    # Imported here: cached-license startups never touch the network stack
+    import requests  # Ensure 'requests' library is installed (pip install requests)
+
+    try:
+        payload = {"licenseKey": key}
+        logger_main.debug("Posting to backend: %s", BACKEND_VERIFY_URL)
+        response = _post_verify_request(payload)
+        if response is None:
+            logger_main.warning("License verification cancelled by user.")
+            return None, None, None, False  # A cancel is a failed check, not an outage
+        logger_main.debug("Backend response status: %s", response.status_code)
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        logger_main.debug("Backend response data: %s", data)
+
+        if data.get("valid") is True:
+            # --- Success! Get the tier ---
+            # Default to BASIC if tier is missing or unknown from backend
+            verified_tier = data.get("tier", "basic").upper()
+            if verified_tier not in ["BASIC", "PRO"]:  # Add "COMMERCIAL" later
+                logger_main.warning(
+                    f"Received unknown tier '{verified_tier}' from backend. Defaulting to BASIC."
                 )
-            QMessageBox.critical(
-                None,
-                "Activation Error",
-                f"Could not verify license: {e.response.status_code} {error_detail}.",
+                verified_tier = "BASIC"
+            return verified_tier, None, None, False
+
+        # Backend said invalid
+        error_msg = data.get("error", "Invalid license key reported by server.")
+        logger_main.warning(f"Backend reported invalid key: {error_msg}")
+        return None, "Invalid Key", f"{error_msg}", False
+
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code
+        if status in RETRYABLE_STATUS_CODES:
+            # Still failing after the adapter's retries: the server is busy, not the key bad
+            logger_main.warning(
+                f"Activation server unavailable after retries (HTTP {status})."
             )
-            return False  # Failed verification
-        except requests.exceptions.Timeout:
-            logger_main.error("Timeout during license verification call.")
-            QApplication.restoreOverrideCursor()
-            QMessageBox.critical(
+            return (
                 None,
-                "Activation Timeout",
-                "Activation server timed out. Check internet and try again.",
+                "Activation Server Busy",
+                f"The activation server is temporarily unavailable (HTTP {status}).\n"
+                "Please try again in a few minutes.",
+                True,
             )
-            return False  # Failed verification
-        except requests.exceptions.RequestException as e:
-            logger_main.error(
-                f"Network Error during license verification: {e}", exc_info=True
+        # Client errors (4xx) are final; report them straight away
+        logger_main.error(
+            f"HTTP Error: {e.response.status_code} - {e.response.text}",
+            exc_info=True,
+        )
+        try:
+            error_detail = _json_loads(e.response.content).get(
+                "error", e.response.reason
             )
-            QApplication.restoreOverrideCursor()
-            QMessageBox.critical(
-                None,
-                "Network Error",
-                f"Could not connect to activation server:\n{e}\nCheck internet.",
+        except:
+            error_detail = (
+                e.response.reason
+                if hasattr(e.response, "reason")
+                else "Unknown HTTP Error"
             )
-            return False  # Failed verification
-        except Exception as e:
-            logger_main.exception("Unexpected Error during license verification:")
-            QApplication.restoreOverrideCursor()
-            QMessageBox.critical(
-                None, "Activation Error", f"Unexpected error during activation:\n{e}"
+        return (
+            None,
+            "Activation Error",
+            f"Could not verify license: {e.response.status_code} {error_detail}.",
+            False,
+        )
+    except requests.exceptions.Timeout:
+        logger_main.error("Timeout during license verification call.")
+        return (
+            None,
+            "Activation Timeout",
+            "Activation server timed out. Check internet and try again.",
+            True,
+        )
+    except requests.exceptions.RequestException as e:
+        logger_main.error(
+            f"Network Error during license verification: {e}", exc_info=True
+        )
+        return (
+            None,
+            "Network Error",
+            f"Could not connect to activation server:\n{e}\nCheck internet.",
+            True,
+        )
+    except Exception as e:
+        logger_main.exception("Unexpected Error during license verification:")
+        return (
+            None,
+            "Activation Error",
+            f"Unexpected error during activation:\n{e}",
+            False,
+        )
+
+
+def verify_license_with_backend():
+    """
+    Prompts user if needed and verifies key against the secure backend.
+    Sets config.TIER based on verification result.
+
+    A successful verification is cached (signed, in QSettings) for
+    LICENSE_CACHE_TTL_SECONDS. After that the key kept in the OS credential
+    store (keyring) is re-verified silently; without keyring the user is
+    prompted again. A machine that can't reach the backend keeps the cached
+    tier for LICENSE_OFFLINE_GRACE_SECONDS more, without waiting on retries.
+
+    Returns:
+        bool: True if license is valid and tier is set, False otherwise.
+    """
+    cached = _load_license_cache()
+    if cached:
+        if time.time() < cached["expires_at"]:
+            logger_main.info(
+                f"Valid license cache found. Skipping prompt. Cached Tier: {cached['tier']}"
             )
-            return False  # Failed verification
-        finally:
-            QApplication.restoreOverrideCursor()
+            config.TIER = cached["tier"]  # <<< SET TIER FROM CACHE
+            return True
 
-    elif ok and not key:
+        if not _backend_reachable():
+            if time.time() < cached["expires_at"] + LICENSE_OFFLINE_GRACE_SECONDS:
+                logger_main.warning(
+                    f"License cache expired and backend unreachable. Using cached "
+                    f"tier {cached['tier']} within the offline grace period."
+                )
+                config.TIER = cached["tier"]
+                return True
+            logger_main.error("Offline grace period over and backend unreachable.")
+            QMessageBox.critical(
+                None,
+                "Activation Required",
+                "Your license must be re-verified online, but the activation server "
+                "can't be reached.\nConnect to the internet and restart the application.",
+            )
+            return False
+
+        stored_key = _load_license_key()
+        if stored_key:
+            logger_main.info("License cache expired. Re-verifying stored key.")
+            tier, title, message, network_problem = _verify_key(stored_key)
+            if tier:
+                config.TIER = tier
+                logger_main.info(f"--- Re-verified Tier: {config.TIER} ---")
+                try:
+                    _save_license_cache(tier)
+                except Exception as e_cache:
+                    logger_main.error(f"Failed to refresh license cache: {e_cache}")
+                return True
+            if title is None:
+                # Cancelled: not a verdict on the key, so the cache is left alone
+                QMessageBox.warning(None, "License Required", "Activation was cancelled.")
+                return False
+            if network_problem:
+                if time.time() < cached["expires_at"] + LICENSE_OFFLINE_GRACE_SECONDS:
+                    logger_main.warning(
+                        f"Re-verification failed ({message}). Using cached tier "
+                        f"{cached['tier']} within the offline grace period."
+                    )
+                    config.TIER = cached["tier"]
+                    return True
+                QMessageBox.critical(None, title, message)
+                return False
+            logger_main.warning("Stored license key rejected. Prompting for a new key.")
+            _clear_license_cache()
+            _forget_license_key()
+        else:
+            logger_main.info("License cache expired. Prompting to re-verify the key.")
+
+    # --- Prompt user and perform ONLINE check if no valid cache ---
+    # Warm the pooled connection in the background while the key dialog is open
+    threading.Thread(
+        target=_prewarm_backend_connection, name="license-prewarm", daemon=True
+    ).start()
+
+    # Empty input re-prompts in place; the cache above is only consulted once
+    while True:
+        key, ok = QInputDialog.getText(
+            None, "Activate Snowball Annotation", "Please enter your license key:"
+        )
+        if not ok:
+            # User cancelled
+            QMessageBox.warning(None, "License Required", "A license key is required.")
+            return False  # Indicate failure
+        key = key.strip()
+        if key:
+            break
         QMessageBox.warning(None, "License Required", "Please enter your license key.")
-        return verify_license_with_backend()  # Re-prompt
-    else:
-        # User cancelled
-        QMessageBox.warning(None, "License Required", "A license key is required.")
-        return False  # Indicate failure
+
+    logger_main.info(f"Attempting verification for key ending in ...{key[-4:]}")
+    verified_tier, title, message, network_problem = _verify_key(key)
+    if verified_tier is None:
+        if title is not None and not network_problem:
+            # Rejected by the backend: an old cache must not keep the offline grace alive
+            _clear_license_cache()
+            _forget_license_key()
+        if title is None:
+            QMessageBox.warning(None, "License Required", "Activation was cancelled.")
+        else:
+            QMessageBox.critical(None, title, message)
+        # Let main block handle exit
+        return False  # Failed verification
+
+    config.TIER = verified_tier  # <<< SET TIER FROM BACKEND RESPONSE
+    logger_main.info(f"--- Activated Tier: {config.TIER} ---")
+    QMessageBox.information(
+        None,
+        "Activated",
+        f"Thank you! License verified successfully.\nTier: {verified_tier.capitalize()}",
+    )
+
+    # --- Store signed license cache ---
+    try:
+        _save_license_cache(config.TIER)
+        logger_main.info("Stored license cache in application settings.")
+    except Exception as e_cache:
+        logger_main.error(f"Failed to store license cache: {e_cache}")
+        # Non-critical, app can proceed but will ask next time
+    _store_license_key(key)
+
+    return True  # Return success
 
 
 if __name__ == "__main__":
     # --- Setup Logging ---
     # (Keep your existing logging setup here)
-    log_path = "app_debug.log"
+    log_path = LOG_FILE_NAME
     try:
-        # Ensure APP_DIR exists before trying to use it for logging
-        if config.APP_DIR:
-            os.makedirs(config.APP_DIR, exist_ok=True)
-            log_path_candidate = os.path.join(config.APP_DIR, "app_debug.log")
-            # Check if we can write to the directory
-            if os.access(config.APP_DIR, os.W_OK):
-                log_path = log_path_candidate
-            else:
+
+        def _rotating_log_handler(path):
+            # Append to log file, rolling over at 5 MB (3 backups kept)
+            return logging.handlers.RotatingFileHandler(
+                path, maxBytes=5_000_000, backupCount=3, encoding="utf-8"
+            )
+
+        # Opening the file is the write-access check; fall back to the current directory
+        file_handler = None
+        if APP_LOG_PATH:
+            try:
+                os.makedirs(config.APP_DIR, exist_ok=True)
+                log_path = APP_LOG_PATH
+                file_handler = _rotating_log_handler(log_path)
+            except OSError as e_dir:
                 print(
-                    f"[WARNING] No write access to {config.APP_DIR}. Logging to current directory."
+                    f"[WARNING] Cannot write log in {config.APP_DIR} ({e_dir}). Logging to current directory."
                 )
+                log_path = LOG_FILE_NAME
         else:
             print("[WARNING] config.APP_DIR not defined. Logging to current directory.")
+        if file_handler is None:
+            file_handler = _rotating_log_handler(log_path)
 
-        log_handlers = [logging.StreamHandler()]  # Always log to console
-        log_handlers.append(
-            logging.FileHandler(log_path, mode="a")
-        )  # Append to log file
+        log_handlers = [logging.StreamHandler(), file_handler]  # Always log to console
 
+        # Log calls only enqueue; a background listener does the console/file writes.
+        # The QueueHandler formats the record, so the sinks keep the plain default formatter.
+        log_queue = queue.SimpleQueue()
+        log_listener = logging.handlers.QueueListener(
+            log_queue, *log_handlers, respect_handler_level=True
+        )
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(name)s [%(levelname)s] - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
-            handlers=log_handlers,
+            handlers=[logging.handlers.QueueHandler(log_queue)],
             force=True,  # Override any existing logging config
         )
+        log_listener.start()
+        atexit.register(log_listener.stop)  # Flush queued records on exit
         # Define logger_main AFTER basicConfig
         logger_main = logging.getLogger(__name__)
         logger_main.info(f"--- Application Started ---")  # Log start first
@@ -2,16 +2,132 @@
 import os
 import json
 import logging
+import threading
 import torch
 import shutil
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer
+from PyQt6.QtCore import (
+    Qt,
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    pyqtSignal,
+    pyqtSlot,
+    QTimer,
+    QCoreApplication,
+)
 
 import config  # --- TIERING: Needed for config.TIER ---
 
+try:
+    import orjson  # Optional: much faster session/settings (de)serialization
+except ImportError:
+    orjson = None
+
+# Optional binary session format, used when the session path ends in .msgpack
+try:
+    import ormsgpack as _msgpack
+except ImportError:
+    try:
+        import msgpack as _msgpack
+    except ImportError:
+        _msgpack = None
+MSGPACK_SESSION_EXT = ".msgpack"
+
 # Import TrainingPipeline and DatasetHandler (Real or Dummy based on Tier)
 # Use a logger specific to this module scope
 logger_sm = logging.getLogger(__name__)
 
+
+def _read_json_file(path):
+    """Parses a JSON file with orjson when available, else the stdlib decoder."""
+    # One read of the whole file; json.load would pull it through many small reads
+    with open(path, "rb") as f:
+        buf = f.read()
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)  # Accepts bytes and detects the UTF encoding
+
+
+def _write_json_file(path, data, compact=False):
+    """
+    Writes data as JSON with orjson when available, else the stdlib encoder.
+    The payload is encoded up front, written with a single write() call and
+    atomically replaces the target.
+    compact=True drops indentation (for large machine-read files like the session).
+    """
+    payload = None
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            payload = orjson.dumps(data, option=option)
+        except TypeError:  # orjson.JSONEncodeError: a type only the stdlib accepts
+            payload = None
+    if payload is None:
+        if compact:
+            text = json.dumps(data, separators=(",", ":"))
+        else:
+            text = json.dumps(data, indent=4)
+        payload = text.encode("utf-8")
+    _write_file_atomic(path, payload)
+
+
+def _write_file_atomic(path, payload):
+    """Writes bytes to a sibling temp file and swaps it in over path."""
+    # A crash mid-write never leaves a truncated file behind
+    # (os.replace is atomic on POSIX and Windows)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _is_msgpack_path(path):
+    return path.lower().endswith(MSGPACK_SESSION_EXT)
+
+
+def _read_session_file(path):
+    """Loads a session file: msgpack for *.msgpack paths, JSON otherwise."""
+    if not _is_msgpack_path(path):
+        return _read_json_file(path)
+    if _msgpack is None:
+        raise ImportError(
+            "Session file is msgpack but neither 'ormsgpack' nor 'msgpack' is installed."
+        )
+    with open(path, "rb") as f:
+        buf = f.read()
+    if _msgpack.__name__ == "ormsgpack":
+        return _msgpack.unpackb(buf)
+    return _msgpack.unpackb(buf, raw=False)
+
+
+def _write_session_file(path, data):
+    """Saves a session file: msgpack for *.msgpack paths, compact JSON otherwise."""
+    if not _is_msgpack_path(path):
+        _write_json_file(path, data, compact=True)
+        return
+    if _msgpack is None:
+        raise ImportError(
+            "Cannot write msgpack session: neither 'ormsgpack' nor 'msgpack' is installed."
+        )
+    if _msgpack.__name__ == "ormsgpack":
+        payload = _msgpack.packb(data, option=_msgpack.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = _msgpack.packb(data, use_bin_type=True)
+    _write_file_atomic(path, payload)
+
+
 # --- TIERING: Conditionally import REAL backend components only if PRO ---
 _TrainingPipeline = None
 _DatasetHandler = None  # DatasetHandler needed for Basic export.
@@ -42,6 +158,9 @@ except ImportError as e_dh:
         def update_annotation(self, p, d):
             pass
 
+        def bulk_update(self, anns):
+            pass
+
         def get_annotation(self, p):
             return None
 
@@ -118,6 +237,8 @@ if _PredictionWorker is None:
     if "PredictionWorker" not in globals() or globals().get("PredictionWorker") is None:
 
         class _DummyPredictionWorker(QObject):
+            task_kind = "prediction"
+            required_pipeline_attrs = ()
             progress = pyqtSignal(str)
             finished = pyqtSignal(list)
             error = pyqtSignal(str)
@@ -141,6 +262,8 @@ if _TrainingWorker is None:
     if "TrainingWorker" not in globals() or globals().get("TrainingWorker") is None:
 
         class _DummyTrainingWorker(QObject):
+            task_kind = "training"
+            required_pipeline_attrs = ()
             progress = pyqtSignal(str)
             finished = pyqtSignal(str)
             error = pyqtSignal(str)
@@ -160,12 +283,164 @@ if _TrainingWorker is None:
             f"Using dummy TrainingWorker CLASS (Tier: {current_tier_for_import})."
         )
 
+# Image extensions picked up by load_images_from_directory (compared lowercase)
+_IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff", ".tif", ".webp")
+
+# Setting keys used by StateManager, resolved once from config.SETTING_KEYS
+_SESSION_PATH_KEY = config.SETTING_KEYS.get("session_path", "paths.session_path")
+_TRIG20_KEY = config.SETTING_KEYS["training.trigger_20_enabled"]
+_TRIG100_KEY = config.SETTING_KEYS["training.trigger_100_enabled"]
+_EPOCHS_20_KEY = config.SETTING_KEYS.get("epochs_20")
+_LR_20_KEY = config.SETTING_KEYS.get("lr_20")
+_EPOCHS_100_KEY = config.SETTING_KEYS.get("epochs_100")
+_LR_100_KEY = config.SETTING_KEYS.get("lr_100")
+_CONF_KEY = config.SETTING_KEYS["confidence_threshold"]
+
+# Auto-train trigger level -> (epochs key, LR key, default epochs, default LR, run kind)
+_TRIGGER_PARAMS = {
+    100: (
+        _EPOCHS_100_KEY,
+        _LR_100_KEY,
+        config.DEFAULT_EPOCHS_100,
+        config.DEFAULT_LR_100,
+        "major",
+    ),
+    20: (
+        _EPOCHS_20_KEY,
+        _LR_20_KEY,
+        config.DEFAULT_EPOCHS_20,
+        config.DEFAULT_LR_20,
+        "mini",
+    ),
+}
+
+
+def _trigger_level(count, trig_20_enabled, trig_100_enabled):
+    """Returns 100, 20 or None for the approved count; the 100 trigger takes precedence."""
+    if count <= 0:
+        return None
+    if trig_100_enabled and count % 100 == 0:
+        return 100
+    if trig_20_enabled and count % 20 == 0:
+        return 20
+    return None
+
+
+# Every setting key the app defines; unknown keys are still stored but logged
+_KNOWN_SETTING_KEYS = frozenset(config.SETTING_KEYS.values())
+
+# Setting keys whose change must be pushed to the training pipeline (resolved once)
+_PIPELINE_SETTING_KEYS = frozenset(
+    config.SETTING_KEYS[k]
+    for k in (
+        "epochs_20",
+        "lr_20",
+        "epochs_100",
+        "lr_100",
+        "img_size",
+        "aug_flipud",
+        "aug_fliplr",
+        "aug_degrees",
+        "base_model",
+        "model_save_path",
+        "runs_dir",
+    )
+    if config.SETTING_KEYS.get(k)
+)
+
 # Assign final classes to be used
 DatasetHandler = _DatasetHandler
 TrainingPipeline = _TrainingPipeline  # Will be real (Pro) or dummy
 PredictionWorker = _PredictionWorker  # Will be real (Pro) or dummy
 TrainingWorker = _TrainingWorker  # Will be real (Pro) or dummy
 
+# Real-vs-dummy is fixed once the imports above have run; resolve it once
+_IS_REAL_PIPELINE_CLASS = not TrainingPipeline.__name__.startswith("_Dummy")
+_IS_REAL_PREDICTION_WORKER = not PredictionWorker.__name__.startswith("_Dummy")
+_IS_REAL_TRAINING_WORKER = not TrainingWorker.__name__.startswith("_Dummy")
+
+
+class _WorkerRunnable(QRunnable):
+    """Runs a worker object's run() on the StateManager task pool."""
+
+    def __init__(self, worker, priority=QThread.Priority.NormalPriority):
+        super().__init__()
+        self.worker = worker
+        self.priority = priority
+
+    def run(self):
+        # The pool thread is reused across tasks, so name and priority are applied
+        # per task (names show up in profilers) and restored once run() returns
+        thread = QThread.currentThread()
+        thread.setObjectName(type(self.worker).__name__)
+        thread.setPriority(self.priority)
+        try:
+            self.worker.run()
+        finally:
+            thread.setPriority(QThread.Priority.NormalPriority)
+            thread.setObjectName("StateManagerTaskPool")
+
+
+class _SaveSessionRunnable(QRunnable):
+    """Writes a session snapshot to disk (on the save pool for autosaves)."""
+
+    def __init__(self, session_file, session_data):
+        super().__init__()
+        self.session_file = session_file
+        self.session_data = session_data
+
+    def run(self):
+        self.write()
+
+    def write(self):
+        """Performs the write; returns True on success (failures are logged)."""
+        try:
+            save_dir = os.path.dirname(self.session_file)
+            if save_dir:
+                os.makedirs(save_dir, exist_ok=True)
+            _write_session_file(self.session_file, self.session_data)
+            logger_sm.info("Session saved successfully.")
+            return True
+        except Exception as e:
+            logger_sm.error(
+                f"Failed save session {self.session_file}: {e}", exc_info=True
+            )
+            return False
+
+
+class _ProgressThrottler(QObject):
+    """
+    Trailing-edge throttle for progress messages: a burst of trigger() calls
+    produces at most one throttled emit per interval, carrying the latest message.
+    """
+
+    throttled = pyqtSignal(str)
+
+    def __init__(self, parent=None, timeout_ms=16):
+        super().__init__(parent)
+        self._last_message = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout_ms)
+        self._timer.timeout.connect(self._emit_last)
+
+    @pyqtSlot(str)
+    def trigger(self, message):
+        self._last_message = message
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @pyqtSlot()
+    def _emit_last(self):
+        message, self._last_message = self._last_message, None
+        if message is not None:
+            self.throttled.emit(message)
+
+    def flush(self):
+        """Emits any held message now, so it can't land after a later signal."""
+        self._timer.stop()
+        self._emit_last()
+
 
 class StateManager(QObject):
     # Signals (Define all, but some only emitted in Pro)
@@ -178,27 +453,36 @@ class StateManager(QObject):
     task_running = pyqtSignal(bool)
     settings_changed = pyqtSignal()
 
+    # Type conversion applied in set_setting, keyed by the type of the key's default
+    _COERCERS = {bool: bool, int: int, float: float, str: str}
+
     def __init__(self, class_list):
         super().__init__()
         self.image_list = []
         self.current_index = -1
         self.annotations = {}
         self._settings = {}
+        # Defaults are static for the process; build them (and their types) once
+        self._defaults = config.get_default_settings()
+        self._default_types = {
+            k: type(v) for k, v in self._defaults.items() if v is not None
+        }
         self._user_settings_path = config.DEFAULT_SETTINGS_PATH
         self.load_settings()  # Load settings first
 
         # Determine session path based on loaded settings
-        session_path_key = config.SETTING_KEYS.get("session_path", "paths.session_path")
         session_dir = os.path.dirname(
-            self.get_setting(session_path_key, config.DEFAULT_SESSION_PATH)
+            self.get_setting(_SESSION_PATH_KEY, config.DEFAULT_SESSION_PATH)
         )
         if session_dir:
             os.makedirs(session_dir, exist_ok=True)
         self.session_path = self.get_setting(
-            session_path_key, config.DEFAULT_SESSION_PATH
+            _SESSION_PATH_KEY, config.DEFAULT_SESSION_PATH
         )
 
-        self.approved_count = 0
+        self._approved_paths = set()  # Kept in step with annotations' "approved" flags
+        self._trigger_20_enabled = True  # Refreshed by update_internal_from_settings
+        self._trigger_100_enabled = True
         self.class_list = sorted(list(set(class_list))) if class_list else []
         self.last_successful_run_dir = None  # Pro feature artifact
 
@@ -227,6 +511,9 @@ class StateManager(QObject):
             logger_sm.exception("FATAL: Failed TrainingPipeline init.")
             self.training_pipeline = None  # Ensure it's None on failure
 
+        # Handler and pipeline are fixed for this instance; check export support once
+        self._export_unavailable_reason = self._check_export_support()
+
         # --- MOVED TIER ASSIGNMENT HERE ---
         # Set the instance's tier based on the global config value (set by main.py)
         self.current_tier = getattr(config, "TIER", "UNKNOWN")
@@ -236,10 +523,62 @@ class StateManager(QObject):
         # Apply loaded settings to pipeline etc. NOW that self.current_tier exists
         self.update_internal_from_settings()
 
-        # Initialize worker/thread attributes
-        self._current_thread = None
+        # Settings writes are debounced too (sliders emit many changes per second);
+        # a pending write is flushed on quit
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(500)
+        self._settings_save_timer.timeout.connect(self.save_settings)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_settings)
+
+        # Coalesces bursts of annotation edits into one session write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._autosave_session)
+        # Autosave writes run here; a single thread keeps them in submission order
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
+        # task_running is coalesced: a False immediately followed by True (chained
+        # tasks) reaches observers as no change instead of a disable/enable flicker
+        self._task_running_state = False
+        self._pending_task_running = False
+        self._task_running_timer = QTimer(self)
+        self._task_running_timer.setSingleShot(True)
+        self._task_running_timer.setInterval(20)
+        self._task_running_timer.timeout.connect(self._flush_task_running)
+
+        # Initialize worker/task attributes. One pooled thread runs every task, so
+        # tasks stay serialized and no thread is created or joined per click.
+        self._task_pool = QThreadPool(self)
+        self._task_pool.setMaxThreadCount(1)
+        # Never retire the idle thread (default is after 30 s), so alternating
+        # predict/train clicks never pay for thread creation again
+        self._task_pool.setExpiryTimeout(-1)
+        # Prediction progress can arrive faster than the UI repaints; ~60 Hz is plenty
+        self._prediction_progress_throttler = _ProgressThrottler(self, timeout_ms=16)
+        self._prediction_progress_throttler.throttled.connect(self.prediction_progress)
+        # Worker task_kind -> (progress slot, finished signal, error signal)
+        self._task_routes = {
+            "prediction": (
+                self._prediction_progress_throttler.trigger,
+                self.prediction_finished,
+                self.prediction_error,
+            ),
+            "training": (
+                self.training_progress,
+                self.training_run_completed,
+                self.training_error,
+            ),
+        }
         self._current_worker = None
-        self._blocking_task_running = False
+        # Reusable workers (those with set_inputs) keyed by class; they stay wired
+        self._idle_workers = {}
+        # Held while a blocking task runs; acquired without blocking as a test-and-set
+        self._task_lock = threading.Lock()
 
         # Final log message confirming initialization
         logger_sm.info(
@@ -252,12 +591,11 @@ class StateManager(QObject):
 
     def load_settings(self):
         """Loads settings, applying defaults first."""
-        self._settings = config.get_default_settings()
+        self._settings = dict(self._defaults)  # Fresh copy; self._defaults stays pristine
         logger_sm.info(f"Loading settings from: {self._user_settings_path}")
         try:
             if os.path.exists(self._user_settings_path):
-                with open(self._user_settings_path, "r") as f:
-                    user_settings = json.load(f)
+                user_settings = _read_json_file(self._user_settings_path)
                 # Optional TIERING: Filter loaded settings here if needed
                 self._settings.update(user_settings)
                 logger_sm.info("Loaded user settings.")
@@ -269,25 +607,39 @@ class StateManager(QObject):
                 f"Using defaults.",
                 exc_info=True,
             )
-            self._settings = config.get_default_settings()  # Reset on error
+            self._settings = dict(self._defaults)  # Reset on error
 
     def save_settings(self):
         """Saves current settings dictionary to file."""
+        if hasattr(self, "_settings_save_timer"):
+            self._settings_save_timer.stop()  # This write covers any pending one
         logger_sm.debug(f"Saving settings to: {self._user_settings_path}")
         try:
             os.makedirs(os.path.dirname(self._user_settings_path), exist_ok=True)
             # Optional TIERING: Filter settings before saving if needed
-            with open(self._user_settings_path, "w") as f:
-                json.dump(self._settings, f, indent=4)
+            _write_json_file(self._user_settings_path, self._settings)
             logger_sm.info("User settings saved.")
         except Exception as e:
             logger_sm.error(
                 f"Failed save settings {self._user_settings_path}: {e}", exc_info=True
             )
 
+    def flush_settings(self):
+        """Writes settings now if a debounced save is still pending."""
+        if self._settings_save_timer.isActive():
+            self.save_settings()
+
     def get_setting(self, key, default=None):
         """Gets a setting value, falling back to config defaults, then provided default."""
-        config_default = config.get_default_settings().get(key)
+        return self._resolve_setting(key, default)
+
+    def get_many(self, keys, defaults=None):
+        """Gets several settings at once; returns {key: value}. defaults maps key -> fallback."""
+        defaults = defaults or {}
+        return {key: self._resolve_setting(key, defaults.get(key)) for key in keys}
+
+    def _resolve_setting(self, key, default):
+        config_default = self._defaults.get(key)
         effective_default = config_default if config_default is not None else default
         val = self._settings.get(key, effective_default)
         # Ensure bools stay bools
@@ -295,43 +647,71 @@ class StateManager(QObject):
             return bool(val)
         return val
 
-    def set_setting(self, key, value):
-        """Sets a setting value, attempts type conversion, saves, and notifies."""
-        is_known_key = any(key == kp for kp in config.SETTING_KEYS.values())
+    def _coerce_setting(self, key, value):
+        """Converts value to the type of the key's default. Returns (ok, new_value)."""
+        is_known_key = key in _KNOWN_SETTING_KEYS
         if not is_known_key:
             logger_sm.warning(f"Setting unknown key: {key}")
 
         # Optional TIERING: Prevent setting Pro keys if Basic
         # if self.current_tier == "BASIC" and key in PRO_ONLY_KEYS: return
 
-        original_value = self._settings.get(key)
         new_value = value
         try:  # Attempt type conversion based on default type
-            default_val = config.get_default_settings().get(key)
-            expected_type = type(default_val) if default_val is not None else None
-            if expected_type == bool:
-                new_value = bool(value)
-            elif expected_type == int:
-                new_value = int(value)
-            elif expected_type == float:
-                new_value = float(value)
-            elif expected_type == str:
-                new_value = str(value)
+            coerce = self._COERCERS.get(self._default_types.get(key))
+            if coerce is not None:
+                new_value = coerce(value)
         except (ValueError, TypeError):
             logger_sm.error(
-                f"Invalid type for setting '{key}': '{value}'. Keeping '{original_value}'."
+                f"Invalid type for setting '{key}': '{value}'. Keeping '{self._settings.get(key)}'."
             )
+            return False, None
+        return True, new_value
+
+    def _is_same_setting(self, key, value):
+        """True if value is already stored for key with the same type (no coercion needed)."""
+        if key not in self._settings:
+            return False
+        current = self._settings[key]
+        return type(value) is type(current) and value == current
+
+    def set_setting(self, key, value):
+        """Sets a setting value, attempts type conversion, saves, and notifies."""
+        if self._is_same_setting(key, value):
+            logger_sm.debug(f"Setting '{key}' value unchanged: {value}")
+            return
+        ok, new_value = self._coerce_setting(key, value)
+        if not ok:
             return
 
-        if original_value != new_value:
+        if self._settings.get(key) != new_value:
             self._settings[key] = new_value
             logger_sm.info(f"Setting '{key}' updated to: {new_value}")
-            self.save_settings()
+            self._settings_save_timer.start()  # Restarted by each change in a burst
             self.update_internal_from_settings(key)
             self.settings_changed.emit()
         else:
             logger_sm.debug(f"Setting '{key}' value unchanged: {new_value}")
 
+    def set_many(self, values):
+        """Sets several settings with a single save and a single settings_changed emit."""
+        changed = []
+        for key, value in values.items():
+            if self._is_same_setting(key, value):
+                continue
+            ok, new_value = self._coerce_setting(key, value)
+            if ok and self._settings.get(key) != new_value:
+                self._settings[key] = new_value
+                logger_sm.info(f"Setting '{key}' updated to: {new_value}")
+                changed.append(key)
+        if not changed:
+            logger_sm.debug("set_many: no setting values changed.")
+            return
+        self._settings_save_timer.start()
+        # One key: targeted refresh; several: full refresh (changed_key=None)
+        self.update_internal_from_settings(changed[0] if len(changed) == 1 else None)
+        self.settings_changed.emit()
+
     def update_internal_from_settings(self, changed_key=None):
         """Updates internal state (like session path, pipeline settings) from settings dict."""
         # --- IMPORTANT: Check if self.current_tier exists before using it ---
@@ -345,36 +725,23 @@ class StateManager(QObject):
         logger_sm.debug(
             f"Updating internal state from settings (changed: {changed_key})."
         )
-        session_path_key = config.SETTING_KEYS.get("session_path")
-        if session_path_key and (
-            changed_key is None or changed_key == session_path_key
-        ):
+        if changed_key is None or changed_key == _SESSION_PATH_KEY:
             self.session_path = self.get_setting(
-                session_path_key, config.DEFAULT_SESSION_PATH
+                _SESSION_PATH_KEY, config.DEFAULT_SESSION_PATH
             )
 
+        # Auto-train trigger flags are read on every approval; keep them cached here
+        if changed_key is None or changed_key == _TRIG20_KEY:
+            self._trigger_20_enabled = self.get_setting(_TRIG20_KEY, True)
+        if changed_key is None or changed_key == _TRIG100_KEY:
+            self._trigger_100_enabled = self.get_setting(_TRIG100_KEY, True)
+
         # --- TIERING: Only update REAL pipeline if Pro ---
-        pipeline_relevant_keys = [
-            config.SETTING_KEYS.get(k)
-            for k in [
-                "epochs_20",
-                "lr_20",
-                "epochs_100",
-                "lr_100",
-                "img_size",
-                "aug_flipud",
-                "aug_fliplr",
-                "aug_degrees",
-                "base_model",
-                "model_save_path",
-                "runs_dir",
-            ]
-            if config.SETTING_KEYS.get(k)
-        ]
+        pipeline_relevant_keys = _PIPELINE_SETTING_KEYS
         is_real_pipeline = (
             self.training_pipeline
             and hasattr(self.training_pipeline, "update_settings")
-            and TrainingPipeline.__name__ != "_DummyTrainingPipeline"
+            and _IS_REAL_PIPELINE_CLASS
         )
 
         if (
@@ -400,23 +767,57 @@ class StateManager(QObject):
                 f"Skipping pipeline settings update for key '{changed_key}'."
             )
 
+    @property
+    def _blocking_task_running(self):
+        return self._task_lock.locked()
+
+    @_blocking_task_running.setter
+    def _blocking_task_running(self, value):
+        # Assigning False (also done by the window's error path) releases the guard
+        if value:
+            self._task_lock.acquire(blocking=False)
+        elif self._task_lock.locked():
+            try:
+                self._task_lock.release()
+            except RuntimeError:
+                pass  # Released concurrently
+
+    @property
+    def approved_count(self):
+        """Number of approved images; derived from _approved_paths, never stored."""
+        return len(self._approved_paths)
+
+    @property
+    def last_successful_run_dir(self):
+        return self._last_successful_run_dir
+
+    @last_successful_run_dir.setter
+    def last_successful_run_dir(self, value):
+        self._last_successful_run_dir = value
+        self._last_run_dir_validated = None  # Re-check on next get_last_run_path()
+
     def get_last_run_path(self):
         """Returns the path to the last successful training run directory (Pro only)."""
         # --- TIERING: This is a Pro artifact ---
         if self.current_tier != "PRO":
             return None
-        return self.last_successful_run_dir
+        # Validated lazily (not during load_session): one isdir per assigned path
+        if self._last_run_dir_validated is None:
+            run_dir = self._last_successful_run_dir
+            if run_dir and not os.path.isdir(run_dir):
+                logger_sm.warning(f"Last run directory no longer exists: {run_dir}")
+                self.last_successful_run_dir = None
+            self._last_run_dir_validated = True
+        return self._last_successful_run_dir
 
     # --- Core State Methods ---
 
     def load_session(self, file_path=None):
-        """Loads session data from a JSON file."""
+        """Loads session data from a JSON (or *.msgpack) file."""
         session_file = (
             file_path
             if file_path
-            else self.get_setting(
-                config.SETTING_KEYS["session_path"], self.session_path
-            )
+            else self.get_setting(_SESSION_PATH_KEY, self.session_path)
         )
         logger_sm.info(f"Attempting to load session from: {session_file}")
         try:
@@ -427,15 +828,14 @@ class StateManager(QObject):
                 self.image_list = []
                 self.annotations = {}
                 self.current_index = -1
-                self.approved_count = 0
+                self._approved_paths.clear()
                 self.last_successful_run_dir = None
                 if self.dataset_handler:
                     self.dataset_handler.annotations.clear()
                 self.settings_changed.emit()
                 return True
 
-            with open(session_file, "r") as f:
-                session_data = json.load(f)
+            session_data = _read_session_file(session_file)
 
             loaded_images = session_data.get("image_list", [])
             loaded_anns = session_data.get("annotations", {})
@@ -448,11 +848,8 @@ class StateManager(QObject):
                 if self.current_tier == "PRO"
                 else None
             )
-            if (
-                loaded_run_dir
-                and isinstance(loaded_run_dir, str)
-                and os.path.isdir(loaded_run_dir)
-            ):
+            if loaded_run_dir and isinstance(loaded_run_dir, str):
+                # Existence is checked on first use in get_last_run_path()
                 self.last_successful_run_dir = loaded_run_dir
                 logger_sm.info(
                     f"[PRO] Loaded last successful run dir: {self.last_successful_run_dir}"
@@ -480,7 +877,8 @@ class StateManager(QObject):
             self.annotations = loaded_anns if isinstance(loaded_anns, dict) else {}
 
             # Clean up annotations for images not in the list
-            keys_to_remove = [p for p in self.annotations if p not in self.image_list]
+            image_set = set(self.image_list)  # O(1) membership instead of a list scan
+            keys_to_remove = [p for p in self.annotations if p not in image_set]
             if keys_to_remove:
                 logger_sm.warning(
                     f"Removing {len(keys_to_remove)} annotations for missing images."
@@ -497,18 +895,21 @@ class StateManager(QObject):
             else:
                 self.current_index = loaded_index
 
-            # Recalculate approved count and update dataset handler
-            self.approved_count = 0
-            if self.dataset_handler:
-                self.dataset_handler.annotations.clear()
+            # Rebuild the approved index/count and update dataset handler
+            self._approved_paths.clear()
+            has_invalid = False
             for img_path, data in self.annotations.items():
                 if isinstance(data, dict):
                     if data.get("approved"):
-                        self.approved_count += 1
-                    if self.dataset_handler:
-                        self.dataset_handler.update_annotation(img_path, data)
+                        self._approved_paths.add(img_path)
                 else:
+                    has_invalid = True
                     logger_sm.warning(f"Invalid ann data type for {img_path}.")
+            self._replace_dataset_annotations(
+                {p: d for p, d in self.annotations.items() if isinstance(d, dict)}
+                if has_invalid
+                else self.annotations
+            )
 
             if classes_changed:
                 self.update_pipeline_classes()  # Updates real or dummy
@@ -524,65 +925,73 @@ class StateManager(QObject):
             logger_sm.error(f"Failed load session {session_file}: {e}", exc_info=True)
             return False
 
-    def save_session(self):
-        """Saves current state (images, annotations, index, classes) to session file."""
-        session_file = self.get_setting(
-            config.SETTING_KEYS["session_path"], self.session_path
-        )
+    def save_session(self, background=False):
+        """
+        Saves current state (images, annotations, index, classes) to session file.
+        Returns True on success. Explicit saves write synchronously; background=True
+        (debounced autosave) queues the write on the save pool and returns at once.
+        """
+        if hasattr(self, "_save_timer"):
+            self._save_timer.stop()  # This write covers any pending debounced save
+        session_file = self.get_setting(_SESSION_PATH_KEY, self.session_path)
         logger_sm.info(f"Saving session to: {session_file}")
+        # Shallow snapshot: annotation entries are replaced, never mutated in place,
+        # so copying the containers is enough for the writer thread
         session_data = {
-            "image_list": self.image_list,
-            "annotations": self.annotations,
+            "image_list": list(self.image_list),
+            "annotations": dict(self.annotations),
             "current_index": self.current_index,
-            "class_list": self.class_list,
+            "class_list": list(self.class_list),
             # --- TIERING: Only include Pro artifacts if Pro ---
             "last_successful_run_dir": self.last_successful_run_dir
             if self.current_tier == "PRO"
             else None,
         }
-        try:
-            save_dir = os.path.dirname(session_file)
-            if save_dir:
-                os.makedirs(save_dir, exist_ok=True)
-            with open(session_file, "w") as f:
-                json.dump(session_data, f, indent=4)
-            logger_sm.info("Session saved successfully.")
-        except Exception as e:
-            logger_sm.error(f"Failed save session {session_file}: {e}", exc_info=True)
+        runnable = _SaveSessionRunnable(session_file, session_data)
+        if not hasattr(self, "_save_pool"):
+            return runnable.write()  # Called before __init__ finished
+        if background:
+            self._save_pool.start(runnable)
+            return True
+        # Let queued autosaves land first so this (newest) snapshot is written last
+        self._save_pool.waitForDone()
+        return runnable.write()
+
+    @pyqtSlot()
+    def _autosave_session(self):
+        self.save_session(background=True)
 
     def load_images_from_directory(self, directory_path):
         """Loads image paths from a directory, resetting state if different."""
         logger_sm.info(f"Loading images from directory: {directory_path}")
-        formats = tuple(
-            f".{ext}"
-            for ext in ["png", "jpg", "jpeg", "bmp", "gif", "tiff", "tif", "webp"]
-        )
         try:
-            image_files = sorted(
-                [
-                    os.path.abspath(os.path.join(directory_path, f))
-                    for f in os.listdir(directory_path)
-                    if os.path.isfile(os.path.join(directory_path, f))
-                    and f.lower().endswith(formats)
-                ]
-            )
+            # scandir entries carry the file type from the directory read: no stat per file
+            with os.scandir(directory_path) as entries:
+                image_files = sorted(
+                    os.path.abspath(entry.path)
+                    for entry in entries
+                    if entry.name.lower().endswith(_IMAGE_EXTS) and entry.is_file()
+                )
             if not image_files:
                 logger_sm.warning(f"No supported images in {directory_path}. Clearing.")
                 self.image_list = []
                 self.current_index = -1
                 self.annotations = {}
-                self.approved_count = 0
+                self._approved_paths.clear()
                 self.last_successful_run_dir = None
                 if self.dataset_handler:
                     self.dataset_handler.annotations.clear()
             else:
-                is_new_or_different = set(image_files) != set(self.image_list)
+                # image_files is sorted and de-duplicated already; compare lists first
+                is_new_or_different = image_files != self.image_list and set(
+                    image_files
+                ) != set(self.image_list)
                 if is_new_or_different:
                     logger_sm.info("New directory/content. Resetting annotations.")
                     self.image_list = image_files
                     self.current_index = 0
                     self.annotations = {}
-                    self.approved_count = 0
+                    self._approved_paths.clear()
                     self.last_successful_run_dir = None
                     if self.dataset_handler:
                         self.dataset_handler.annotations.clear()
@@ -645,16 +1054,15 @@ class StateManager(QObject):
             updated_anns = {}
             removed_box_count = 0
             affected_image_count = 0
-            if self.dataset_handler:
-                self.dataset_handler.annotations.clear()
+            approved_paths = set()  # Same pass; filtering never changes approval
 
             for img_path, data in self.annotations.items():
                 if not isinstance(data, dict):
                     continue
+                if data.get("approved"):
+                    approved_paths.add(img_path)
                 if data.get("negative", False):  # Keep negatives
                     updated_anns[img_path] = data
-                    if self.dataset_handler:
-                        self.dataset_handler.update_annotation(img_path, data)
                     continue
 
                 original_boxes = data.get("annotations_list", [])
@@ -667,24 +1075,23 @@ class StateManager(QObject):
                         img_had_removed = True
                         removed_box_count += 1
 
-                new_data = data.copy()
-                new_data["annotations_list"] = filtered_boxes
+                if img_had_removed or "annotations_list" not in data:
+                    # Copy only when the entry changes; the old dict may still be referenced
+                    new_data = data.copy()
+                    new_data["annotations_list"] = filtered_boxes
+                else:
+                    new_data = data  # Nothing filtered out: reuse as-is
                 updated_anns[img_path] = new_data
                 if img_had_removed:
                     affected_image_count += 1
-                if self.dataset_handler:
-                    self.dataset_handler.update_annotation(img_path, new_data)
 
             if removed_box_count > 0:
                 logger_sm.warning(
                     f"Removed {removed_box_count} boxes from {affected_image_count} images."
                 )
             self.annotations = updated_anns
-            self.approved_count = sum(
-                1
-                for d in self.annotations.values()
-                if isinstance(d, dict) and d.get("approved")
-            )
+            self._replace_dataset_annotations(updated_anns)
+            self._approved_paths = approved_paths
             logger_sm.info(f"Approved count after class change: {self.approved_count}")
             self.update_pipeline_classes()
             self.save_session()
@@ -692,12 +1099,23 @@ class StateManager(QObject):
         else:
             logger_sm.info("Class list unchanged.")
 
+    def _replace_dataset_annotations(self, annotations):
+        """Installs the full annotation map in the dataset handler in one call."""
+        if not self.dataset_handler:
+            return
+        if hasattr(self.dataset_handler, "bulk_update"):
+            self.dataset_handler.bulk_update(annotations)
+        else:  # Older/dummy handler: per-item fallback
+            self.dataset_handler.annotations.clear()
+            for img_path, data in annotations.items():
+                self.dataset_handler.update_annotation(img_path, data)
+
     def update_pipeline_classes(self):
         """Updates the classes in the training pipeline instance (if real)."""
         is_real_pipeline = (
             self.training_pipeline
             and hasattr(self.training_pipeline, "update_classes")
-            and TrainingPipeline.__name__ != "_DummyTrainingPipeline"
+            and _IS_REAL_PIPELINE_CLASS
         )
         if self.current_tier == "PRO" and is_real_pipeline:
             logger_sm.info("[PRO] Updating REAL TrainingPipeline classes...")
@@ -723,70 +1141,49 @@ class StateManager(QObject):
         )
         is_approved_now = annotation_data.get("approved", False)
         self.annotations[image_path] = annotation_data
+        if is_approved_now:
+            self._approved_paths.add(image_path)
+        else:
+            self._approved_paths.discard(image_path)
 
-        # Update approved count
         if is_approved_now != was_approved_before:
-            self.approved_count += 1 if is_approved_now else -1
-            self.approved_count = max(0, self.approved_count)
             logger_sm.debug(f"Approved count updated: {self.approved_count}")
 
         # Update dataset handler
         if self.dataset_handler:
             self.dataset_handler.update_annotation(image_path, annotation_data)
 
-        # Save session asynchronously
-        QTimer.singleShot(100, self.save_session)
+        # Save session asynchronously; restarting the timer folds rapid edits into one write
+        self._save_timer.start()
 
         # --- TIERING: Training Triggers (PRO ONLY) ---
         if is_approved_now and not was_approved_before:
             is_real_pipeline = (
                 self.training_pipeline
-                and TrainingPipeline.__name__ != "_DummyTrainingPipeline"
+                and _IS_REAL_PIPELINE_CLASS
             )
             # Only check triggers if PRO tier and REAL pipeline exists
             if self.current_tier == "PRO" and is_real_pipeline:
                 current_count = self.approved_count
                 epochs, lr, prefix = None, None, None
-                trigger_level = None
 
-                trig_20_en = self.get_setting(
-                    config.SETTING_KEYS["training.trigger_20_enabled"], True
-                )
-                trig_100_en = self.get_setting(
-                    config.SETTING_KEYS["training.trigger_100_enabled"], True
-                )
+                trig_20_en = self._trigger_20_enabled
+                trig_100_en = self._trigger_100_enabled
                 logger_sm.debug(
                     f"[PRO] Checking triggers: 20={trig_20_en}, 100={trig_100_en}"
                 )
 
-                if trig_100_en and current_count > 0 and current_count % 100 == 0:
-                    trigger_level = 100
-                elif trig_20_en and current_count > 0 and current_count % 20 == 0:
-                    if trigger_level != 100:  # 100 takes precedence
-                        trigger_level = 20
-
-                if trigger_level == 100:
-                    logger_sm.info(
-                        f"[PRO] Count {current_count}: Triggering MAJOR train."
-                    )
-                    epochs = self.get_setting(
-                        config.SETTING_KEYS.get("epochs_100"), config.DEFAULT_EPOCHS_100
+                trigger_level = _trigger_level(current_count, trig_20_en, trig_100_en)
+                if trigger_level is not None:
+                    epochs_key, lr_key, default_epochs, default_lr, run_kind = (
+                        _TRIGGER_PARAMS[trigger_level]
                     )
-                    lr = self.get_setting(
-                        config.SETTING_KEYS.get("lr_100"), config.DEFAULT_LR_100
-                    )
-                    prefix = f"major_{current_count}"
-                elif trigger_level == 20:
                     logger_sm.info(
-                        f"[PRO] Count {current_count}: Triggering MINI train."
-                    )
-                    epochs = self.get_setting(
-                        config.SETTING_KEYS.get("epochs_20"), config.DEFAULT_EPOCHS_20
+                        f"[PRO] Count {current_count}: Triggering {run_kind.upper()} train."
                     )
-                    lr = self.get_setting(
-                        config.SETTING_KEYS.get("lr_20"), config.DEFAULT_LR_20
-                    )
-                    prefix = f"mini_{current_count}"
+                    epochs = self.get_setting(epochs_key, default_epochs)
+                    lr = self.get_setting(lr_key, default_lr)
+                    prefix = f"{run_kind}_{current_count}"
 
                 if epochs is not None and lr is not None and prefix is not None:
                     logger_sm.info(
@@ -818,12 +1215,12 @@ class StateManager(QObject):
             f"[PRO] Request start prediction for {os.path.basename(image_path)}"
         )
         # Check if the REAL worker class is available
-        if PredictionWorker.__name__.startswith("_Dummy"):
+        if not _IS_REAL_PREDICTION_WORKER:
             logger_sm.error("[PRO] PredictionWorker is DUMMY. Prediction unavailable.")
             self.prediction_error.emit("Prediction unavailable (Worker missing/dummy).")
             return False
 
-        current_conf = self.get_setting(config.SETTING_KEYS["confidence_threshold"])
+        current_conf = self.get_setting(_CONF_KEY)
         return self._start_task(PredictionWorker, image_path, current_conf)
 
     def start_training_task(self, epochs, lr, run_name_prefix):
@@ -835,18 +1232,17 @@ class StateManager(QObject):
             return False
 
         # Check if the REAL worker class is available
-        if TrainingWorker.__name__.startswith("_Dummy"):
+        if not _IS_REAL_TRAINING_WORKER:
             logger_sm.error("[PRO] TrainingWorker is DUMMY. Training unavailable.")
             self.training_error.emit("Training unavailable (Worker missing/dummy).")
             return False
 
         logger_sm.info(f"[PRO] Preparing data for training run '{run_name_prefix}'...")
+        # Same guard as export: a stale approved path must not raise KeyError here
         approved_anns = {
-            p: data
-            for p, data in self.annotations.items()
-            if isinstance(data, dict) and data.get("approved")
+            p: self.annotations[p] for p in self._approved_paths if p in self.annotations
         }
-        approved_paths = list(approved_anns.keys())
+        approved_paths = list(approved_anns)
 
         if not approved_paths:
             logger_sm.warning("No approved images for training.")
@@ -862,13 +1258,16 @@ class StateManager(QObject):
         )
 
     def _start_task(self, worker_class, *args):
-        """Internal helper to create and start worker threads."""
+        """Internal helper to create a worker and run it on the task pool."""
         task_name = worker_class.__name__
+        progress_slot, _finished_signal, error_signal = self._task_routes[
+            worker_class.task_kind
+        ]
         is_real_pipeline = (
             self.training_pipeline
-            and TrainingPipeline.__name__ != "_DummyTrainingPipeline"
+            and _IS_REAL_PIPELINE_CLASS
         )
-        is_real_worker = not worker_class.__name__.startswith("_Dummy")
+        is_real_worker = not task_name.startswith("_Dummy")
 
         # Prevent REAL workers if pipeline is DUMMY
         if is_real_worker and not is_real_pipeline:
@@ -876,86 +1275,118 @@ class StateManager(QObject):
                 f"Cannot start REAL {task_name}: Pipeline is dummy or unavailable."
             )
             logger_sm.error(error_msg)
-            is_pred = "Prediction" in task_name
-            if is_pred:
-                self.prediction_error.emit(error_msg)
-            else:
-                self.training_error.emit(error_msg)
+            error_signal.emit(error_msg)
             return False
 
-        if self._blocking_task_running:
+        # Per-worker preconditions declared on the class; dummies declare none
+        missing = [
+            attr
+            for attr in getattr(worker_class, "required_pipeline_attrs", ())
+            if not hasattr(self.training_pipeline, attr)
+        ]
+        if missing:
+            error_msg = (
+                f"Cannot start {task_name}: Pipeline lacks {', '.join(missing)}."
+            )
+            logger_sm.error(error_msg)
+            error_signal.emit(error_msg)
+            return False
+
+        if not self._task_lock.acquire(blocking=False):
             logger_sm.warning(f"Cannot start {task_name}: Another task running.")
-            is_pred = "Prediction" in task_name
-            if is_pred:
-                self.prediction_error.emit("Busy: Another task running.")
-            else:
-                self.training_error.emit("Busy: Another task running.")
+            error_signal.emit("Busy: Another task running.")
             return False
 
-        self._blocking_task_running = True
-        self.task_running.emit(True)
+        self._emit_task_running(True)
 
         try:
-            self._current_thread = QThread()
+            # Reuse an idle worker of this class (already wired) when it belongs to
+            # the current pipeline and its previous run() has fully returned
+            worker = self._idle_workers.get(worker_class)
+            if (
+                worker is not None
+                and worker.pipeline is self.training_pipeline
+                and self._task_pool.activeThreadCount() == 0
+            ):
+                worker.set_inputs(*args)
+                self._current_worker = worker
+                self._task_pool.start(_WorkerRunnable(worker))
+                logger_sm.info(f"Started {task_name} (reused) on background task pool.")
+                return True
+            if worker is not None:
+                self._disconnect_worker(self._idle_workers.pop(worker_class))
+
+            # The worker stays owned by the GUI thread; only run() executes on the
+            # pool thread, so its signals reach our slots as queued calls
             self._current_worker = worker_class(self.training_pipeline, *args)
-            self._current_worker.moveToThread(self._current_thread)
 
-            # Connect signals (should exist on both real and dummy)
-            is_pred = "Prediction" in task_name
-            if hasattr(self._current_worker, "progress"):
-                sig = self.prediction_progress if is_pred else self.training_progress
-                self._current_worker.progress.connect(sig)
-            if hasattr(self._current_worker, "finished"):
-                sig = (
-                    self.prediction_finished if is_pred else self.training_run_completed
-                )
-                self._current_worker.finished.connect(sig)
-            if hasattr(self._current_worker, "error"):
-                sig = self.prediction_error if is_pred else self.training_error
-                self._current_worker.error.connect(sig)
-
-            # Connect finished/error to internal cleanup handler
-            task_id_name = self._current_worker.__class__.__name__
-            if hasattr(self._current_worker, "finished"):
-                self._current_worker.finished.connect(
-                    lambda result=None, name=task_id_name: self._on_task_finished(
-                        name, result
-                    )
-                )
-            if hasattr(self._current_worker, "error"):
-                self._current_worker.error.connect(
-                    lambda name=task_id_name: self._on_task_finished(name, None)
-                )
+            # Every connection is recorded on the worker so _on_task_finished can
+            # disconnect it explicitly instead of leaving it to garbage collection
+            worker = self._current_worker
+            worker._connections = []
+
+            def _wire(signal, slot, *conn_type):
+                signal.connect(slot, *conn_type)
+                worker._connections.append((signal, slot))
 
-            self._current_thread.started.connect(self._current_worker.run)
-            self._current_thread.finished.connect(self._current_thread.deleteLater)
-            if hasattr(self._current_worker, "finished"):
-                self._current_worker.finished.connect(self._current_thread.quit)
-                self._current_worker.finished.connect(self._current_worker.deleteLater)
-            if hasattr(self._current_worker, "error"):
-                self._current_worker.error.connect(self._current_thread.quit)
-                self._current_worker.error.connect(self._current_worker.deleteLater)
-
-            self._current_thread.start()
-            logger_sm.info(f"Started {task_name} in background thread.")
+            # Connect signals (should exist on both real and dummy)
+            if hasattr(worker, "progress"):
+                _wire(worker.progress, progress_slot)
+
+            # finished/error go through declared slots (static meta-object dispatch,
+            # no wrappers) that flush pending progress, then forward to the public
+            # signals; the worker is read from sender() when they run.
+            queued = Qt.ConnectionType.QueuedConnection
+            if hasattr(worker, "finished"):
+                _wire(worker.finished, self._on_worker_finished, queued)
+            if hasattr(worker, "error"):
+                _wire(worker.error, self._on_worker_error, queued)
+
+            # Long training runs yield CPU to the GUI thread; prediction is short
+            priority = (
+                QThread.Priority.LowPriority
+                if worker_class.task_kind == "training"
+                else QThread.Priority.NormalPriority
+            )
+            self._task_pool.start(_WorkerRunnable(self._current_worker, priority))
+            if hasattr(worker, "set_inputs"):
+                self._idle_workers[worker_class] = worker
+            logger_sm.info(f"Started {task_name} on background task pool.")
             return True
 
         except Exception as e:
             logger_sm.exception(f"Error starting worker thread {task_name}")
             error_msg = f"Setup error for {task_name}: {e}"
-            is_pred = "Prediction" in task_name
-            if is_pred:
-                self.prediction_error.emit(error_msg)
-            else:
-                self.training_error.emit(error_msg)
-            if self._current_thread:
-                self._current_thread.quit()
+            error_signal.emit(error_msg)
             self._blocking_task_running = False
-            self.task_running.emit(False)
-            self._current_thread = None
+            self._emit_task_running(False)
+            self._idle_workers.pop(worker_class, None)
+            self._disconnect_worker(self._current_worker)
             self._current_worker = None
             return False
 
+    def _forward_worker_signal(self, route_index, value):
+        """Flushes held progress, then re-emits value on the worker's public signal."""
+        worker = self.sender() or self._current_worker
+        # A task's last progress message must reach observers before its completion
+        self._prediction_progress_throttler.flush()
+        if worker is None:
+            return "UnknownTask"
+        self._task_routes[worker.task_kind][route_index].emit(value)
+        return worker.__class__.__name__
+
+    @pyqtSlot(list)  # PredictionWorker.finished
+    @pyqtSlot(str)  # TrainingWorker.finished (run dir)
+    def _on_worker_finished(self, result):
+        task_name = self._forward_worker_signal(1, result)
+        self._on_task_finished(task_name, result)
+
+    @pyqtSlot(str)
+    def _on_worker_error(self, message):
+        task_name = self._forward_worker_signal(2, message)
+        self._on_task_finished(task_name, None)
+
+    @pyqtSlot(str, object)
     def _on_task_finished(self, task_name, result=None):
         """Internal slot called when a worker finishes or errors."""
         logger_sm.info(
@@ -972,40 +1403,62 @@ class StateManager(QObject):
         ):
             self.last_successful_run_dir = result
             logger_sm.info(f"[PRO] Stored last successful run directory: {result}")
-            QTimer.singleShot(50, self.save_session)  # Persist run dir
+            # Persist run dir via the debounced save: coalesces with pending edits
+            self._save_timer.start()
         elif "PredictionWorker" in task_name and isinstance(result, list):
             logger_sm.debug(f"Prediction task finished with {len(result)} results.")
         elif result is None:
             logger_sm.warning(f"{task_name} task finished with error or no result.")
 
-        # Thread cleanup logic
-        thread_to_clean = self._current_thread
-        if thread_to_clean:
-            logger_sm.debug(f"Cleaning up thread for {task_name}...")
-            if thread_to_clean.isRunning():
-                thread_to_clean.quit()
-                if not thread_to_clean.wait(5000):
-                    logger_sm.warning(f"Thread ({task_name}) didn't finish cleanup.")
-                else:
-                    logger_sm.debug(f"Thread ({task_name}) finished cleanly.")
-            else:
-                logger_sm.debug(f"Thread ({task_name}) was already finished.")
-
+        # No deleteLater chain: the pool thread is reused, the runnable is deleted
+        # by the pool once run() returns, and dropping the Python references
+        # (after disconnecting) lets PyQt destroy the worker. Idle reusable
+        # workers keep their connections for the next run.
+        worker = self._current_worker
+        if worker is not None and self._idle_workers.get(type(worker)) is not worker:
+            self._disconnect_worker(worker)
         if self._blocking_task_running:
             self._blocking_task_running = False
-            self.task_running.emit(False)
+            self._emit_task_running(False)
 
-        self._current_thread = None
         self._current_worker = None
         logger_sm.debug(f"{task_name} task finished processing complete.")
 
+    def _emit_task_running(self, state):
+        self._pending_task_running = state
+        self._task_running_timer.start()
+
+    @pyqtSlot()
+    def _flush_task_running(self):
+        if self._pending_task_running != self._task_running_state:
+            self._task_running_state = self._pending_task_running
+            self.task_running.emit(self._task_running_state)
+
+    def _disconnect_worker(self, worker):
+        """Drops the connections made in _start_task so nothing keeps the worker alive."""
+        for signal, slot in getattr(worker, "_connections", ()):
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or the C++ side is gone
+        if worker is not None:
+            worker._connections = []
+
+    @pyqtSlot(result=bool)
     def is_task_active(self):
         """Returns True if a blocking background task is running."""
         return self._blocking_task_running
 
+    @pyqtSlot()
     def cleanup(self):
         """Cleans up resources, attempts to stop running workers."""
         logger_sm.info("StateManager cleanup initiated.")
+        self.flush_settings()
+        if self._save_timer.isActive():
+            logger_sm.info("Flushing pending session save.")
+            self.save_session()
+        if not self._save_pool.waitForDone(7000):
+            logger_sm.warning("Session save didn't finish during cleanup.")
         if (
             self._blocking_task_running
             and self._current_worker
@@ -1018,19 +1471,18 @@ class StateManager(QObject):
             except Exception as e:
                 logger_sm.error(f"Error signaling worker ({worker_name}) stop: {e}")
 
-        thread_to_clean = self._current_thread
-        if thread_to_clean and thread_to_clean.isRunning():
-            logger_sm.info("Waiting for running thread during cleanup...")
-            if not thread_to_clean.wait(7000):
-                logger_sm.warning("Worker thread didn't finish gracefully.")
+        if self._task_pool.activeThreadCount() > 0:
+            logger_sm.info("Waiting for running task during cleanup...")
+            if not self._task_pool.waitForDone(7000):
+                logger_sm.warning("Worker task didn't finish gracefully.")
             else:
-                logger_sm.info("Worker thread finished during cleanup.")
+                logger_sm.info("Worker task finished during cleanup.")
 
         # --- TIERING: Only cleanup REAL pipeline if Pro ---
         is_real_pipeline = (
             self.training_pipeline
             and hasattr(self.training_pipeline, "cleanup")
-            and TrainingPipeline.__name__ != "_DummyTrainingPipeline"
+            and _IS_REAL_PIPELINE_CLASS
         )
         if self.current_tier == "PRO" and is_real_pipeline:
             try:
@@ -1043,57 +1495,58 @@ class StateManager(QObject):
         elif self.training_pipeline and hasattr(self.training_pipeline, "cleanup"):
             logger_sm.debug("Skipping cleanup for DUMMY pipeline.")
 
+        self._disconnect_worker(self._current_worker)
+        for worker in self._idle_workers.values():
+            self._disconnect_worker(worker)
+        self._idle_workers.clear()
         self._current_worker = None
-        self._current_thread = None
         self._blocking_task_running = False
         logger_sm.info("StateManager cleanup finished.")
 
     # --- Data Export (Basic & Pro) ---
 
+    def _check_export_support(self):
+        """Returns why YOLO export can't work with this handler/pipeline, or None."""
+        if not self.dataset_handler:
+            return "DatasetHandler unavailable."
+        if not hasattr(self.dataset_handler, "export_for_yolo"):
+            return "DH missing 'export_for_yolo'."
+        if not self.training_pipeline or not hasattr(
+            self.training_pipeline, "class_to_id"
+        ):
+            return "Pipeline (real/dummy) or map missing."
+        return None
+
     def export_data_for_yolo(self, target_dir):
         """Exports approved annotations in YOLO format."""
         # This is needed for Basic tier as well.
         logger_sm.info(f"Attempting export YOLO data to: {target_dir}")
-        if not self.dataset_handler:
-            logger_sm.error("Cannot export: DatasetHandler unavailable.")
-            return None
-        if not hasattr(self.dataset_handler, "export_for_yolo"):
-            logger_sm.error("Cannot export: DH missing 'export_for_yolo'.")
+        if self._export_unavailable_reason:
+            logger_sm.error(f"Cannot export: {self._export_unavailable_reason}")
             return None
 
         # Get class map - needed for export regardless of tier.
-        if not self.training_pipeline or not hasattr(
-            self.training_pipeline, "class_to_id"
-        ):
-            logger_sm.error("Cannot export: Pipeline (real/dummy) or map missing.")
-            return None
         class_to_id = self.training_pipeline.class_to_id
         if not class_to_id:  # Check if map is empty
             logger_sm.error("Cannot export: Class map is empty.")
             return None
 
-        approved_paths = [
-            p
-            for p, data in self.annotations.items()
-            if isinstance(data, dict) and data.get("approved")
-        ]
-        if not approved_paths:
-            logger_sm.warning("No approved images found for export.")
-            return None
-
+        # One pass over the approved index (kept current by add_annotation/loads)
         export_annotations = {
-            p: self.annotations[p] for p in approved_paths if p in self.annotations
+            p: self.annotations[p] for p in self._approved_paths if p in self.annotations
         }
         if not export_annotations:
-            logger_sm.error("No valid annotation data for approved paths.")
+            logger_sm.warning("No approved images found for export.")
             return None
 
         # Use the potentially DUMMY DatasetHandler instance
         original_handler_anns = None
         yaml_path = None
         try:
-            # Temporarily set the annotations on the handler instance
-            original_handler_anns = self.dataset_handler.annotations.copy()
+            # Temporarily set the annotations on the handler instance. The binding is
+            # swapped and restored, so keeping the reference (no copy) is enough;
+            # export_for_yolo only reads from the dict it is given.
+            original_handler_anns = self.dataset_handler.annotations
             self.dataset_handler.annotations = export_annotations
             logger_sm.debug(
                 f"Temporarily set DH with {len(export_annotations)} annotations."
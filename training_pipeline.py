@@ -33,6 +33,10 @@ class DatasetHandler:
         """Update annotation for a given image."""
         self.annotations[image_path] = annotation_data
 
+    def bulk_update(self, annotations):
+        """Replace all stored annotations with a copy of the given {image_path: data} map."""
+        self.annotations = dict(annotations)
+
     def get_annotation(self, image_path):
         """Retrieve annotation data for a given image."""
         return self.annotations.get(image_path)
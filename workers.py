@@ -7,10 +7,15 @@ logger = logging.getLogger(__name__)
 
 class PredictionWorker(QObject):
     """Worker for running pipeline.auto_box."""
+    task_kind = "prediction"  # Selects the StateManager signals this worker feeds
+    required_pipeline_attrs = ("auto_box",)  # Checked by StateManager before start
     progress = pyqtSignal(str); finished = pyqtSignal(list); error = pyqtSignal(str)
     def __init__(self, pipeline, image_data, confidence_threshold):
         super().__init__(); self.pipeline = pipeline; self.image_data = image_data
         self.confidence_threshold = confidence_threshold; self._is_running = True
+    def set_inputs(self, image_data, confidence_threshold):
+        """Re-arms an idle worker for another run so StateManager can reuse it."""
+        self.image_data = image_data; self.confidence_threshold = confidence_threshold; self._is_running = True
     def run(self):
         try:
             if not self.pipeline: raise RuntimeError("Predict Worker: Pipeline unavailable.")
@@ -30,6 +35,8 @@ class PredictionWorker(QObject):
 # --- <<< UPDATED __init__, run args, and finished signal >>> ---
 class TrainingWorker(QObject):
     """Worker for running pipeline.run_training_session."""
+    task_kind = "training"  # Selects the StateManager signals this worker feeds
+    required_pipeline_attrs = ("run_training_session",)  # Checked before start
     progress = pyqtSignal(str)
     finished = pyqtSignal(str) # Emit run_dir path on success
     error = pyqtSignal(str)